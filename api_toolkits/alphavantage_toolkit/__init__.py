@@ -1,4 +1,5 @@
 """AlphaVantage API toolkit."""
-from .av_client import AlphaVantageClient
+from .av_client import AlphaVantageClient, AlphaVantageError, get_alphavantage
+from .av_async_client import AsyncAlphaVantageClient
 
-__all__ = ['AlphaVantageClient'] 
\ No newline at end of file
+__all__ = ['AlphaVantageClient', 'AlphaVantageError', 'AsyncAlphaVantageClient', 'get_alphavantage']
\ No newline at end of file
@@ -0,0 +1,317 @@
+"""Async AlphaVantage API client implementation."""
+from typing import Dict, Any, Optional, List, Mapping, Tuple
+import csv
+from io import StringIO
+import aiohttp
+from ..async_base_client import AsyncBaseAPIClient
+from ..cache import NOT_MODIFIED, ResponseCache, ttl_lru_cache
+from ..config import APIConfig
+from .av_client import AlphaVantageClient, _check_csv_error, _check_error
+
+class AsyncAlphaVantageClient(AsyncBaseAPIClient):
+    """Asyncio client for interacting with the AlphaVantage API.
+
+    Mirrors AlphaVantageClient with ``async def`` endpoints so many symbols can
+    be fetched concurrently, e.g.::
+
+        async with AsyncAlphaVantageClient() as client:
+            overviews = await client.gather(client.get_company_overview(s) for s in symbols)
+    """
+
+    DEFAULT_CACHE_TTLS = AlphaVantageClient.DEFAULT_CACHE_TTLS
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, int]] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        """Initialize the async AlphaVantage client.
+
+        Args:
+            api_key: Optional API key (will use environment variable if not provided)
+            max_concurrency: Maximum number of requests in flight
+            cache: Optional response cache (caching is disabled if not provided)
+            cache_ttls: Optional TTL overrides in seconds, keyed by AlphaVantage function
+            session: Optional session shared with other clients (not closed by close())
+        """
+        api_key = api_key or APIConfig.ALPHAVANTAGE_API_KEY
+        if not api_key:
+            raise ValueError("AlphaVantage API key is required")
+
+        super().__init__(
+            api_key=api_key,
+            base_url=APIConfig.ALPHAVANTAGE_BASE_URL,
+            calls_per_minute=APIConfig.ALPHAVANTAGE_RATE_LIMIT,
+            max_concurrency=max_concurrency,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            session=session
+        )
+
+    def _cache_ttl(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Look up the cache TTL by AlphaVantage function rather than endpoint."""
+        return self.cache_ttls.get((params or {}).get('function'))
+
+    async def _send_request(self, url: str, *args: Any, **kwargs: Any) -> Tuple[Any, Mapping[str, str]]:
+        """Send a request and raise on AlphaVantage error payloads before they are cached."""
+        data, headers = await super()._send_request(url, *args, **kwargs)
+        if isinstance(data, str):
+            _check_csv_error(data)
+            return data, headers
+        return _check_error(data), headers
+
+    async def _query(self, function: str, **params: Any) -> Dict[str, Any]:
+        """Call an AlphaVantage JSON function.
+
+        Args:
+            function: AlphaVantage function name (e.g. 'OVERVIEW')
+            **params: Additional query parameters
+
+        Returns:
+            API response as a dictionary
+        """
+        params['function'] = function
+        params['apikey'] = self.api_key
+        return await self._make_request(endpoint='', params=params)
+
+    async def _get_csv(self, params: Dict[str, Any], force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """Fetch and parse a CSV endpoint, caching the parsed rows.
+
+        Args:
+            params: Query parameters for the request
+            force_refresh: Bypass the cache and fetch a fresh response
+
+        Returns:
+            List of rows keyed by CSV header
+        """
+        async def fetch(validators: Dict[str, str]) -> Tuple[Any, Mapping[str, str]]:
+            text, headers = await self._send_request(self.base_url, params=params, headers=validators, as_text=True)
+            if text is NOT_MODIFIED:
+                return NOT_MODIFIED, headers
+            return list(csv.DictReader(StringIO(text))), headers
+
+        return await self._cached_call(
+            self.base_url,
+            params,
+            self._cache_ttl('', params),
+            fetch,
+            force_refresh=force_refresh
+        )
+
+    async def get_time_series_daily(
+        self,
+        symbol: str,
+        outputsize: str = 'compact',
+        datatype: str = 'json'
+    ) -> Dict[str, Any]:
+        """Get daily time series for a symbol.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            outputsize: 'compact' (last 100 data points) or 'full' (up to 20 years)
+            datatype: 'json' or 'csv'
+
+        Returns:
+            Daily time series data
+        """
+        return await self._query(
+            'TIME_SERIES_DAILY',
+            symbol=symbol,
+            outputsize=outputsize,
+            datatype=datatype
+        )
+
+    @ttl_lru_cache(0)
+    async def get_company_overview(self, symbol: str) -> Dict[str, Any]:
+        """Get company information and financial ratios.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+
+        Returns:
+            Company overview data
+        """
+        return await self._query('OVERVIEW', symbol=symbol)
+
+    async def get_etf_profile(self, symbol: str) -> Dict[str, Any]:
+        """Get ETF profile and holdings information.
+
+        Args:
+            symbol: ETF symbol (e.g., 'QQQ')
+
+        Returns:
+            ETF profile and holdings data
+        """
+        return await self._query('ETF_PROFILE', symbol=symbol)
+
+    async def get_dividends(self, symbol: str) -> Dict[str, Any]:
+        """Get historical and future dividend distributions.
+
+        Args:
+            symbol: Stock symbol (e.g., 'IBM')
+
+        Returns:
+            Dividend distribution data
+        """
+        return await self._query('DIVIDENDS', symbol=symbol)
+
+    async def get_splits(self, symbol: str) -> Dict[str, Any]:
+        """Get historical split events.
+
+        Args:
+            symbol: Stock symbol (e.g., 'IBM')
+
+        Returns:
+            Split events data
+        """
+        return await self._query('SPLITS', symbol=symbol)
+
+    async def get_income_statement(self, symbol: str) -> Dict[str, Any]:
+        """Get annual and quarterly income statements.
+
+        Args:
+            symbol: Stock symbol (e.g., 'IBM')
+
+        Returns:
+            Income statement data
+        """
+        return await self._query('INCOME_STATEMENT', symbol=symbol)
+
+    async def get_balance_sheet(self, symbol: str) -> Dict[str, Any]:
+        """Get annual and quarterly balance sheets.
+
+        Args:
+            symbol: Stock symbol (e.g., 'IBM')
+
+        Returns:
+            Balance sheet data
+        """
+        return await self._query('BALANCE_SHEET', symbol=symbol)
+
+    async def get_cash_flow(self, symbol: str) -> Dict[str, Any]:
+        """Get annual and quarterly cash flow statements.
+
+        Args:
+            symbol: Stock symbol (e.g., 'IBM')
+
+        Returns:
+            Cash flow statement data
+        """
+        return await self._query('CASH_FLOW', symbol=symbol)
+
+    async def get_earnings(self, symbol: str) -> Dict[str, Any]:
+        """Get quarterly and annual earnings data.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+
+        Returns:
+            Earnings history data
+        """
+        return await self._query('EARNINGS', symbol=symbol)
+
+    async def get_listing_status(
+        self,
+        date: Optional[str] = None,
+        state: str = 'active'
+    ) -> List[Dict[str, Any]]:
+        """Get list of active or delisted US stocks and ETFs.
+
+        Args:
+            date: Optional date in YYYY-MM-DD format (must be after 2010-01-01)
+            state: 'active' or 'delisted'
+
+        Returns:
+            List of stocks/ETFs matching the criteria
+        """
+        params = {
+            'function': 'LISTING_STATUS',
+            'apikey': self.api_key,
+            'state': state
+        }
+        if date:
+            params['date'] = date
+
+        return await self._get_csv(params)
+
+    async def get_earnings_calendar(
+        self,
+        symbol: Optional[str] = None,
+        horizon: str = '3month'
+    ) -> List[Dict[str, Any]]:
+        """Get list of company earnings expected in the next 3, 6, or 12 months.
+
+        Args:
+            symbol: Optional stock symbol to filter by
+            horizon: '3month', '6month', or '12month'
+
+        Returns:
+            List of upcoming earnings events
+        """
+        params = {
+            'function': 'EARNINGS_CALENDAR',
+            'apikey': self.api_key,
+            'horizon': horizon
+        }
+        if symbol:
+            params['symbol'] = symbol
+
+        return await self._get_csv(params)
+
+    async def get_ipo_calendar(self) -> List[Dict[str, Any]]:
+        """Get list of IPOs expected in the next 3 months.
+
+        Returns:
+            List of upcoming IPO events
+        """
+        return await self._get_csv({
+            'function': 'IPO_CALENDAR',
+            'apikey': self.api_key
+        })
+
+    async def get_global_quote(self, symbol: str) -> Dict[str, Any]:
+        """Get current quote data for a symbol.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+
+        Returns:
+            Latest quote data
+        """
+        return await self._query('GLOBAL_QUOTE', symbol=symbol)
+
+    async def search_symbol(self, keywords: str) -> List[Dict[str, Any]]:
+        """Search for symbols based on keywords.
+
+        Args:
+            keywords: Search keywords
+
+        Returns:
+            List of matching symbols and their details
+        """
+        return await self._query('SYMBOL_SEARCH', keywords=keywords)
+
+    async def get_tops(self) -> Dict[str, Any]:
+        """Get top 20 gainers, losers, and most actively traded tickers in the US market.
+
+        Note:
+            By default, this data is updated at the end of each trading day.
+            Premium API keys may receive real-time or 15-minute delayed data.
+
+        Returns:
+            Dictionary containing three lists:
+            - top_gainers: List of stocks with highest % gains
+            - top_losers: List of stocks with highest % losses
+            - most_actively_traded: List of stocks with highest trading volume
+
+            Each stock entry contains:
+            - ticker: Stock symbol
+            - price: Current price
+            - change_amount: Price change
+            - change_percentage: Percentage change
+            - volume: Trading volume (for most active stocks)
+        """
+        return await self._query('TOP_GAINERS_LOSERS')
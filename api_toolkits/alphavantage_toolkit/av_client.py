@@ -1,18 +1,90 @@
 """AlphaVantage API client implementation."""
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping, Tuple, TYPE_CHECKING
+import codecs
 import csv
 from io import StringIO
-from ..base_client import BaseAPIClient
+from ..base_client import BaseAPIClient, get_shared_client
+from ..cache import NOT_MODIFIED, ResponseCache
 from ..config import APIConfig
+from ..json_utils import loads
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+class AlphaVantageError(Exception):
+    """Raised when AlphaVantage answers with an error or rate limit message."""
+
+# Keys of the bodies AlphaVantage sends, with HTTP 200, instead of data
+ERROR_KEYS = ('Error Message', 'Note', 'Information')
+
+def _check_error(data: Any) -> Any:
+    """Raise if a decoded AlphaVantage response is an error or throttling notice.
+    
+    AlphaVantage answers invalid calls and rate limiting with HTTP 200 and a
+    body such as ``{"Note": "Thank you for using Alpha Vantage! ..."}``.
+    
+    Args:
+        data: Decoded response body
+        
+    Returns:
+        The response body unchanged
+        
+    Raises:
+        AlphaVantageError: If the body is an error, note or information message
+    """
+    if isinstance(data, dict):
+        for key in ERROR_KEYS:
+            if key in data:
+                raise AlphaVantageError(data[key])
+    return data
+
+def _check_csv_error(first_line: str, rest: str = '') -> None:
+    """Raise if a CSV endpoint answered with a JSON error body instead of CSV.
+    
+    Args:
+        first_line: First line of the response body
+        rest: Remainder of the body, needed to decode a multi-line JSON message
+        
+    Raises:
+        AlphaVantageError: If the body is a JSON object
+    """
+    if first_line.lstrip().startswith('{'):
+        data = loads(first_line + rest)
+        _check_error(data)
+        raise AlphaVantageError(f"Unexpected JSON response to a CSV request: {data}")
 
 class AlphaVantageClient(BaseAPIClient):
     """Client for interacting with the AlphaVantage API."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Cache TTLs in seconds, keyed by the AlphaVantage `function` parameter
+    DEFAULT_CACHE_TTLS = {
+        'OVERVIEW': 604800,
+        'ETF_PROFILE': 86400,
+        'DIVIDENDS': 86400,
+        'SPLITS': 86400,
+        'INCOME_STATEMENT': 86400,
+        'BALANCE_SHEET': 86400,
+        'CASH_FLOW': 86400,
+        'EARNINGS': 86400,
+        'LISTING_STATUS': 86400,
+        'EARNINGS_CALENDAR': 86400,
+        'IPO_CALENDAR': 86400,
+        'GLOBAL_QUOTE': 30,
+        'SYMBOL_SEARCH': 604800,
+    }
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, int]] = None
+    ):
         """Initialize the AlphaVantage client.
         
         Args:
             api_key: Optional API key (will use environment variable if not provided)
+            cache: Optional response cache (caching is disabled if not provided)
+            cache_ttls: Optional TTL overrides in seconds, keyed by AlphaVantage function
         """
         api_key = api_key or APIConfig.ALPHAVANTAGE_API_KEY
         if not api_key:
@@ -21,7 +93,68 @@ class AlphaVantageClient(BaseAPIClient):
         super().__init__(
             api_key=api_key,
             base_url=APIConfig.ALPHAVANTAGE_BASE_URL,
-            calls_per_minute=APIConfig.ALPHAVANTAGE_RATE_LIMIT
+            calls_per_minute=APIConfig.ALPHAVANTAGE_RATE_LIMIT,
+            cache=cache,
+            cache_ttls=cache_ttls
+        )
+        # Send the API key with every request instead of adding it per call
+        self.session.params = {'apikey': self.api_key}
+    
+    def _cache_ttl(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Look up the cache TTL by AlphaVantage function rather than endpoint."""
+        return self.cache_ttls.get((params or {}).get('function'))
+    
+    def _send_request(self, endpoint: str, *args: Any, **kwargs: Any) -> Tuple[Any, Mapping[str, str]]:
+        """Send a request and raise on AlphaVantage error payloads before they are cached."""
+        data, headers = super()._send_request(endpoint, *args, **kwargs)
+        return _check_error(data), headers
+    
+    def _query(self, function: str, **params: Any) -> Dict[str, Any]:
+        """Call an AlphaVantage JSON function.
+        
+        Args:
+            function: AlphaVantage function name (e.g. 'OVERVIEW')
+            **params: Additional query parameters
+            
+        Returns:
+            API response as a dictionary
+        """
+        params['function'] = function
+        return self._make_request(endpoint='', params=params)
+    
+    def _get_csv(self, params: Dict[str, Any], force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """Fetch and parse a CSV endpoint, caching the parsed rows.
+        
+        Args:
+            params: Query parameters for the request
+            force_refresh: Bypass the cache and fetch a fresh response
+            
+        Returns:
+            List of rows keyed by CSV header
+        """
+        def fetch(validators: Dict[str, str]) -> Tuple[Any, Mapping[str, str]]:
+            response = self._request('GET', self.base_url, params=params, headers=validators, stream=True)
+            
+            # Parse the CSV as it streams in, decoding lines ourselves rather
+            # than materializing response.text
+            with response:
+                if response.status_code == 304:
+                    return NOT_MODIFIED, response.headers
+                lines = codecs.iterdecode(response.iter_lines(), 'utf-8')
+                first_line = next(lines, '')
+                # Errors and rate limit notices come back as JSON, not CSV
+                if first_line.lstrip().startswith('{'):
+                    _check_csv_error(first_line, '\n'.join(lines))
+                rows = csv.reader(lines)
+                header = tuple(next(csv.reader([first_line]), ()))
+                return [dict(zip(header, row)) for row in rows if row], response.headers
+        
+        return self._cached_call(
+            self.base_url,
+            params,
+            self._cache_ttl('', params),
+            fetch,
+            force_refresh=force_refresh
         )
     
     def get_time_series_daily(
@@ -40,15 +173,11 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             Daily time series data
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'TIME_SERIES_DAILY',
-                'symbol': symbol,
-                'apikey': self.api_key,
-                'outputsize': outputsize,
-                'datatype': datatype
-            }
+        return self._query(
+            'TIME_SERIES_DAILY',
+            symbol=symbol,
+            outputsize=outputsize,
+            datatype=datatype
         )
     
     def get_company_overview(self, symbol: str) -> Dict[str, Any]:
@@ -60,14 +189,18 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             Company overview data
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'OVERVIEW',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-        )
+        return self._query('OVERVIEW', symbol=symbol)
+    
+    def get_overviews(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get company overviews for several symbols concurrently.
+        
+        Args:
+            symbols: Stock symbols (e.g., ['AAPL', 'MSFT'])
+            
+        Returns:
+            Company overview data keyed by symbol
+        """
+        return dict(zip(symbols, self.map(self.get_company_overview, symbols)))
     
     def get_etf_profile(self, symbol: str) -> Dict[str, Any]:
         """Get ETF profile and holdings information.
@@ -78,14 +211,7 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             ETF profile and holdings data
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'ETF_PROFILE',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-        )
+        return self._query('ETF_PROFILE', symbol=symbol)
     
     def get_dividends(self, symbol: str) -> Dict[str, Any]:
         """Get historical and future dividend distributions.
@@ -96,14 +222,7 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             Dividend distribution data
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'DIVIDENDS',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-        )
+        return self._query('DIVIDENDS', symbol=symbol)
     
     def get_splits(self, symbol: str) -> Dict[str, Any]:
         """Get historical split events.
@@ -114,14 +233,7 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             Split events data
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'SPLITS',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-        )
+        return self._query('SPLITS', symbol=symbol)
     
     def get_income_statement(self, symbol: str) -> Dict[str, Any]:
         """Get annual and quarterly income statements.
@@ -132,14 +244,7 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             Income statement data
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'INCOME_STATEMENT',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-        )
+        return self._query('INCOME_STATEMENT', symbol=symbol)
     
     def get_balance_sheet(self, symbol: str) -> Dict[str, Any]:
         """Get annual and quarterly balance sheets.
@@ -150,14 +255,7 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             Balance sheet data
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'BALANCE_SHEET',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-        )
+        return self._query('BALANCE_SHEET', symbol=symbol)
     
     def get_cash_flow(self, symbol: str) -> Dict[str, Any]:
         """Get annual and quarterly cash flow statements.
@@ -168,14 +266,7 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             Cash flow statement data
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'CASH_FLOW',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-        )
+        return self._query('CASH_FLOW', symbol=symbol)
     
     def get_earnings(self, symbol: str) -> Dict[str, Any]:
         """Get quarterly and annual earnings data.
@@ -186,14 +277,7 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             Earnings history data
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'EARNINGS',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-        )
+        return self._query('EARNINGS', symbol=symbol)
     
     def get_listing_status(
         self,
@@ -211,21 +295,50 @@ class AlphaVantageClient(BaseAPIClient):
         """
         params = {
             'function': 'LISTING_STATUS',
-            'apikey': self.api_key,
             'state': state
         }
         if date:
             params['date'] = date
             
-        response = self.session.get(
-            self.base_url,
-            params=params
-        )
-        response.raise_for_status()
+        return self._get_csv(params)
+    
+    def get_listing_status_df(
+        self,
+        date: Optional[str] = None,
+        state: str = 'active'
+    ) -> 'pd.DataFrame':
+        """Get list of active or delisted US stocks and ETFs as a DataFrame.
+        
+        Parses the CSV with pandas' C parser, which is much faster than building
+        dictionaries for the full listing. The CSV text is error-checked and
+        cached like the other CSV endpoints, in its own entry next to the
+        parsed rows cached by get_listing_status.
+        
+        Args:
+            date: Optional date in YYYY-MM-DD format (must be after 2010-01-01)
+            state: 'active' or 'delisted'
+            
+        Returns:
+            DataFrame with one row per stock/ETF
+        """
+        import pandas as pd
         
-        # Parse CSV response
-        csv_data = csv.DictReader(StringIO(response.text))
-        return list(csv_data)
+        params = {
+            'function': 'LISTING_STATUS',
+            'state': state
+        }
+        if date:
+            params['date'] = date
+            
+        def fetch(validators: Dict[str, str]) -> Tuple[Any, Mapping[str, str]]:
+            response = self._request('GET', self.base_url, params=params, headers=validators)
+            if response.status_code == 304:
+                return NOT_MODIFIED, response.headers
+            _check_csv_error(response.text)
+            return response.text, response.headers
+        
+        text = self._cached_call(f"{self.base_url}#csv", params, self._cache_ttl('', params), fetch)
+        return pd.read_csv(StringIO(text))
     
     def get_earnings_calendar(
         self,
@@ -243,21 +356,12 @@ class AlphaVantageClient(BaseAPIClient):
         """
         params = {
             'function': 'EARNINGS_CALENDAR',
-            'apikey': self.api_key,
             'horizon': horizon
         }
         if symbol:
             params['symbol'] = symbol
             
-        response = self.session.get(
-            self.base_url,
-            params=params
-        )
-        response.raise_for_status()
-        
-        # Parse CSV response
-        csv_data = csv.DictReader(StringIO(response.text))
-        return list(csv_data)
+        return self._get_csv(params)
     
     def get_ipo_calendar(self) -> List[Dict[str, Any]]:
         """Get list of IPOs expected in the next 3 months.
@@ -265,18 +369,9 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             List of upcoming IPO events
         """
-        response = self.session.get(
-            self.base_url,
-            params={
-                'function': 'IPO_CALENDAR',
-                'apikey': self.api_key
-            }
-        )
-        response.raise_for_status()
-        
-        # Parse CSV response
-        csv_data = csv.DictReader(StringIO(response.text))
-        return list(csv_data)
+        return self._get_csv({
+            'function': 'IPO_CALENDAR'
+        })
     
     def get_global_quote(self, symbol: str) -> Dict[str, Any]:
         """Get current quote data for a symbol.
@@ -287,14 +382,7 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             Latest quote data
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'GLOBAL_QUOTE',
-                'symbol': symbol,
-                'apikey': self.api_key
-            }
-        )
+        return self._query('GLOBAL_QUOTE', symbol=symbol)
     
     def search_symbol(self, keywords: str) -> List[Dict[str, Any]]:
         """Search for symbols based on keywords.
@@ -305,14 +393,7 @@ class AlphaVantageClient(BaseAPIClient):
         Returns:
             List of matching symbols and their details
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'SYMBOL_SEARCH',
-                'keywords': keywords,
-                'apikey': self.api_key
-            }
-        )
+        return self._query('SYMBOL_SEARCH', keywords=keywords)
     
     def get_tops(self) -> Dict[str, Any]:
         """Get top 20 gainers, losers, and most actively traded tickers in the US market.
@@ -334,10 +415,16 @@ class AlphaVantageClient(BaseAPIClient):
             - change_percentage: Percentage change
             - volume: Trading volume (for most active stocks)
         """
-        return self._make_request(
-            endpoint='',
-            params={
-                'function': 'TOP_GAINERS_LOSERS',
-                'apikey': self.api_key
-            }
-        ) 
\ No newline at end of file
+        return self._query('TOP_GAINERS_LOSERS')
+
+
+def get_alphavantage(api_key: Optional[str] = None) -> AlphaVantageClient:
+    """Return the shared AlphaVantageClient for an API key.
+    
+    Args:
+        api_key: Optional API key (will use environment variable if not provided)
+        
+    Returns:
+        Shared client instance (closing it invalidates the shared instance)
+    """
+    return get_shared_client(AlphaVantageClient, api_key)
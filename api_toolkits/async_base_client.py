@@ -0,0 +1,345 @@
+"""Async base client class for API interactions."""
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Dict, Any, Optional, Iterable, Awaitable, List, Callable, Mapping, Tuple, AsyncIterator
+import aiohttp
+from .cache import NOT_MODIFIED, ResponseCache, conditional_headers, make_cache_key
+from .json_utils import loads
+from .rate_limiter import shared_bucket
+
+logger = logging.getLogger(__name__)
+
+# Process-wide session handed out by shared_session()
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+def shared_session() -> aiohttp.ClientSession:
+    """Return one aiohttp session for all async clients, creating it on first use.
+
+    Passing this session to several clients lets them share one connection
+    pool and DNS cache. Call it from inside the running event loop, and close
+    it with close_shared_session() before the loop ends.
+
+    Returns:
+        The shared client session
+    """
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=AsyncBaseAPIClient.POOL_LIMIT, ttl_dns_cache=300),
+            timeout=AsyncBaseAPIClient.DEFAULT_TIMEOUT
+        )
+    return _shared_session
+
+async def close_shared_session() -> None:
+    """Close the session returned by shared_session(), if one was created."""
+    global _shared_session
+    if _shared_session is not None:
+        await _shared_session.close()
+        _shared_session = None
+
+class AsyncBaseAPIClient:
+    """Base class for asyncio API clients with common functionality."""
+
+    # Per-endpoint cache TTLs in seconds; endpoints not listed are never cached
+    DEFAULT_CACHE_TTLS: Dict[str, int] = {}
+
+    # Connection pool size and request timeout in seconds
+    POOL_LIMIT = 32
+    DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5)
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        calls_per_minute: int,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, int]] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        """Initialize the async base client.
+
+        Args:
+            api_key: API key for authentication
+            base_url: Base URL for the API
+            calls_per_minute: Maximum number of API calls allowed per minute
+            max_concurrency: Maximum number of requests in flight (defaults to POOL_LIMIT)
+            cache: Optional response cache (caching is disabled if not provided)
+            cache_ttls: Optional per-endpoint TTL overrides in seconds
+            session: Optional session shared with other clients (e.g. shared_session());
+                the caller stays responsible for closing it
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self.calls_per_minute = calls_per_minute
+        self.cache = cache
+        self.cache_ttls = {**self.DEFAULT_CACHE_TTLS, **(cache_ttls or {})}
+
+        self._session = session
+        self._owns_session = session is None
+        self._headers = self._session_headers()
+        self._bucket = shared_bucket((base_url, api_key), calls_per_minute)
+        self._semaphore = asyncio.Semaphore(max_concurrency or self.POOL_LIMIT)
+
+    def _session_headers(self) -> Dict[str, str]:
+        """Return headers sent with every request (override in subclasses).
+
+        They are added per request rather than set on the session, so the
+        session can be shared with clients for other providers.
+        """
+        return {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the client session, creating it on first use.
+
+        The session is created lazily so it is bound to the running event loop.
+        """
+        if self._owns_session and (self._session is None or self._session.closed):
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.POOL_LIMIT, ttl_dns_cache=300),
+                timeout=self.DEFAULT_TIMEOUT
+            )
+        return self._session
+
+    def _cache_ttl(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Return the cache TTL for a request, or None if it should not be cached.
+
+        Args:
+            endpoint: API endpoint being called
+            params: Query parameters for the request
+
+        Returns:
+            TTL in seconds or None
+        """
+        return self.cache_ttls.get(endpoint)
+
+    async def _cached_call(
+        self,
+        key_url: str,
+        params: Optional[Dict[str, Any]],
+        ttl: Optional[int],
+        fetch: Callable[[Dict[str, str]], Awaitable[Tuple[Any, Mapping[str, str]]]],
+        force_refresh: bool = False
+    ) -> Any:
+        """Return a cached result or await and cache a fresh one.
+
+        Expired entries with an ETag or Last-Modified validator are revalidated
+        with a conditional request, as in BaseAPIClient._cached_call.
+
+        Args:
+            key_url: URL used to build the cache key
+            params: Query parameters used to build the cache key
+            ttl: TTL in seconds, or None to bypass the cache
+            fetch: Coroutine function taking conditional request headers and
+                returning the result (or NOT_MODIFIED) with the response headers
+            force_refresh: Skip the cache lookup and refresh the entry
+
+        Returns:
+            Cached or freshly fetched result
+        """
+        if self.cache is None or ttl is None:
+            return (await fetch({}))[0]
+
+        key = make_cache_key(key_url, params)
+        entry = None
+        if not force_refresh:
+            entry = self.cache.get_entry(key)
+            if entry is not None and entry['expires_at'] > time.time():
+                logger.debug("Cache hit: %s %s", key_url, params)
+                return entry['data']
+
+        logger.debug("Cache miss: %s %s", key_url, params)
+        result, headers = await fetch(conditional_headers(entry))
+        if result is NOT_MODIFIED:
+            self.cache.touch(key, ttl)
+            return entry['data']
+
+        self.cache.set(
+            key,
+            result,
+            ttl,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified')
+        )
+        return result
+
+    async def _iter_cached(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        stream: Callable[[], AsyncIterator[Any]],
+        field: Optional[str] = None
+    ) -> AsyncIterator[Any]:
+        """Yield items from the cache, or stream them and cache them once complete.
+
+        Async counterpart of BaseAPIClient._iter_cached, sharing cache entries
+        with _make_request for the same endpoint.
+
+        Args:
+            endpoint: API endpoint the stream reads
+            params: Query parameters (None values are dropped)
+            stream: Callable returning an async iterator over the response items
+            field: Key of the item list in the cached response body, or None
+                if the body is the list itself
+
+        Yields:
+            Items in response order
+        """
+        params = {k: v for k, v in params.items() if v is not None}
+        ttl = self._cache_ttl(endpoint, params)
+        if self.cache is None or ttl is None:
+            async for item in stream():
+                yield item
+            return
+
+        key_url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        key = make_cache_key(key_url, params)
+        entry = self.cache.get_entry(key)
+        if entry is not None and entry['expires_at'] > time.time():
+            logger.debug("Cache hit: %s %s", key_url, params)
+            data = entry['data']
+            for item in (data if field is None else data[field]):
+                yield item
+            return
+
+        logger.debug("Cache miss: %s %s", key_url, params)
+        items = []
+        async for item in stream():
+            items.append(item)
+            yield item
+        self.cache.set(key, items if field is None else {field: items}, ttl)
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        method: str = 'GET',
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        force_refresh: bool = False,
+        body: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """Make an API request, serving cacheable GET requests from the cache.
+
+        Args:
+            endpoint: API endpoint to call
+            method: HTTP method to use
+            params: Query parameters for the request (None values are dropped)
+            headers: Additional headers for the request
+            force_refresh: Bypass the cache and fetch a fresh response
+            body: Optional object sent as the JSON request body
+
+        Returns:
+            API response as a dictionary
+
+        Raises:
+            aiohttp.ClientError: If the request fails
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        ttl = self._cache_ttl(endpoint, params) if method == 'GET' else None
+        return await self._cached_call(
+            url,
+            params,
+            ttl,
+            lambda validators: self._send_request(url, method, params, {**(headers or {}), **validators}, body=body),
+            force_refresh=force_refresh
+        )
+
+    async def _send_request(
+        self,
+        url: str,
+        method: str = 'GET',
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        as_text: bool = False,
+        body: Optional[Any] = None
+    ) -> Tuple[Any, Mapping[str, str]]:
+        """Send an API request with rate limiting and error handling.
+
+        Args:
+            url: Full URL to call
+            method: HTTP method to use
+            params: Query parameters for the request
+            headers: Additional headers for the request
+            as_text: Return the raw response body instead of decoded JSON
+            body: Optional object sent as the JSON request body
+
+        Returns:
+            Decoded JSON (or the response text if as_text is set, or
+            NOT_MODIFIED on a 304) and the response headers
+
+        Raises:
+            aiohttp.ClientError: If the request fails
+        """
+        async with self._semaphore:
+            await self._bucket.acquire_async()
+            session = await self._get_session()
+            try:
+                async with session.request(method, url, params=params, headers={**self._headers, **(headers or {})}, json=body) as response:
+                    response.raise_for_status()
+                    if response.status == 304:
+                        return NOT_MODIFIED, response.headers
+                    if as_text:
+                        return await response.text(), response.headers
+                    return loads(await response.read()), response.headers
+            except aiohttp.ClientError as e:
+                logger.error("API request failed: %s", e)
+                raise
+
+    @contextlib.asynccontextmanager
+    async def _stream(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[aiohttp.StreamReader]:
+        """Open a rate-limited GET request and yield its undecoded body stream.
+
+        The request keeps its concurrency slot until the context exits, so
+        callers should consume the stream promptly.
+
+        Args:
+            endpoint: API endpoint to call
+            params: Query parameters for the request (None values are dropped)
+
+        Yields:
+            Response body stream for incremental parsing
+
+        Raises:
+            aiohttp.ClientError: If the request fails
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        async with self._semaphore:
+            await self._bucket.acquire_async()
+            session = await self._get_session()
+            try:
+                async with session.get(url, params=params, headers=self._headers) as response:
+                    response.raise_for_status()
+                    yield response.content
+            except aiohttp.ClientError as e:
+                logger.error("API request failed: %s", e)
+                raise
+
+    async def gather(self, coros: Iterable[Awaitable[Any]]) -> List[Any]:
+        """Run several endpoint calls concurrently.
+
+        Concurrency is bounded by the client's semaphore and rate limiter, so
+        callers can pass any number of coroutines.
+
+        Args:
+            coros: Endpoint coroutines, e.g. ``[client.get_company_overview(s) for s in symbols]``
+
+        Returns:
+            Results in the same order as the coroutines
+        """
+        return await asyncio.gather(*coros)
+
+    async def close(self) -> None:
+        """Close the session unless it was passed in by the caller."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> 'AsyncBaseAPIClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
@@ -1,45 +1,313 @@
 """Base client class for API interactions."""
+import atexit
 import logging
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Any, Optional, Callable, Iterable, Iterator, List, Mapping, Tuple, Type, TypeVar
 import requests
-from ratelimit import limits, sleep_and_retry
-from .config import APIConfig
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from .cache import NOT_MODIFIED, ResponseCache, conditional_headers, make_cache_key
+from .json_utils import loads
+from .rate_limiter import retry_after, shared_bucket
+
+logger = logging.getLogger(__name__)
+
+ClientT = TypeVar('ClientT', bound='BaseAPIClient')
+
+# Shared client instances keyed by (client class, api_key)
+_shared_clients: Dict[Tuple[type, Optional[str]], 'BaseAPIClient'] = {}
+_shared_clients_lock = threading.Lock()
+
+def get_shared_client(cls: Type[ClientT], api_key: Optional[str] = None) -> ClientT:
+    """Return a process-wide client instance for a class and API key.
+    
+    Reusing one client keeps its connection pool warm across callers. The
+    instance is closed at interpreter exit; calling ``close()`` on it removes
+    it from the registry so the next call builds a fresh client.
+    
+    Args:
+        cls: Client class to instantiate
+        api_key: Optional API key (the class default is used if not provided)
+        
+    Returns:
+        Shared client instance
+    """
+    key = (cls, api_key)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = cls(api_key=api_key)
+            client._shared_key = key
+            _shared_clients[key] = client
+            atexit.register(client.close)
+        return client
+
+# Thread pool shared by every sync client, created on first use; its worker
+# threads are named with this prefix
+_executor: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_THREAD_PREFIX = 'api_toolkits_pool'
+_executor_lock = threading.Lock()
+
+def shared_executor() -> ThreadPoolExecutor:
+    """Return the thread pool used for concurrent calls by all sync clients.
+    
+    The pool is created once with BaseAPIClient.POOL_MAXSIZE workers and shut
+    down at interpreter exit, so fan-out calls reuse warm threads instead of
+    starting a pool per call.
+    
+    Returns:
+        Shared executor
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=BaseAPIClient.POOL_MAXSIZE,
+                thread_name_prefix=_EXECUTOR_THREAD_PREFIX
+            )
+            atexit.register(_executor.shutdown)
+        return _executor
+
+def map_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int
+) -> List[Any]:
+    """Call a function for each item on the shared thread pool.
+    
+    At most ``max_workers`` calls are in flight at once. A call made from a
+    pool thread (e.g. ``func`` itself fanning out) runs its items inline, so
+    nested calls cannot fill the pool with workers waiting on each other. If
+    a call fails, calls not yet started are cancelled and running ones are
+    waited for before the error is raised.
+    
+    Args:
+        func: Function taking a single item
+        items: Items to process
+        max_workers: Maximum number of concurrent calls
+        
+    Returns:
+        Results in the same order as the items
+    """
+    items = list(items)
+    if threading.current_thread().name.startswith(_EXECUTOR_THREAD_PREFIX):
+        return [func(item) for item in items]
+    
+    results: List[Any] = [None] * len(items)
+    executor = shared_executor()
+    pending = iter(enumerate(items))
+    futures: Dict[Future, int] = {
+        executor.submit(func, item): i for i, item in islice(pending, max(max_workers, 1))
+    }
+    try:
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures.pop(future)] = future.result()
+                for i, item in islice(pending, 1):
+                    futures[executor.submit(func, item)] = i
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        wait(futures)
+        raise
+    return results
 
 class BaseAPIClient:
     """Base class for API clients with common functionality."""
     
-    def __init__(self, api_key: str, base_url: str, calls_per_minute: int):
+    # Per-endpoint cache TTLs in seconds; endpoints not listed are never cached
+    DEFAULT_CACHE_TTLS: Dict[str, int] = {}
+    
+    # Connection pool size per host and (connect, read) timeouts in seconds
+    POOL_MAXSIZE = 32
+    DEFAULT_TIMEOUT = (5, 30)
+    
+    # Attempts made when the server answers 429 Too Many Requests
+    MAX_RATE_LIMIT_RETRIES = 3
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        calls_per_minute: int,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, int]] = None
+    ):
         """Initialize the base client.
         
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
             calls_per_minute: Maximum number of API calls allowed per minute
+            cache: Optional response cache (caching is disabled if not provided)
+            cache_ttls: Optional per-endpoint TTL overrides in seconds
         """
         self.api_key = api_key
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = self._build_session()
         self.calls_per_minute = calls_per_minute
+        self._bucket = shared_bucket((base_url, api_key), calls_per_minute)
+        self.cache = cache
+        self.cache_ttls = {**self.DEFAULT_CACHE_TTLS, **(cache_ttls or {})}
+    
+    def _build_session(self) -> requests.Session:
+        """Create a session with a pooled, retrying HTTP adapter and keep-alive.
+        
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_MAXSIZE,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=['GET']
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'Connection': 'keep-alive',
+            # urllib3 lists gzip/deflate plus br and zstd when their decoders are installed
+            'Accept-Encoding': ACCEPT_ENCODING
+        })
+        return session
+    
+    def _cache_ttl(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Return the cache TTL for a request, or None if it should not be cached.
+        
+        Args:
+            endpoint: API endpoint being called
+            params: Query parameters for the request
+            
+        Returns:
+            TTL in seconds or None
+        """
+        return self.cache_ttls.get(endpoint)
+    
+    def _cached_call(
+        self,
+        key_url: str,
+        params: Optional[Dict[str, Any]],
+        ttl: Optional[int],
+        fetch: Callable[[Dict[str, str]], Tuple[Any, Mapping[str, str]]],
+        force_refresh: bool = False
+    ) -> Any:
+        """Return a cached result or fetch and cache it.
         
-        # Set up logging
-        self.logger = logging.getLogger(self.__class__.__name__)
+        When a cached entry has expired but carries an ETag or Last-Modified
+        validator, the fetch is made conditional; a 304 Not Modified answer
+        reuses the cached body and extends its lifetime.
+        
+        Args:
+            key_url: URL used to build the cache key
+            params: Query parameters used to build the cache key
+            ttl: TTL in seconds, or None to bypass the cache
+            fetch: Callable taking conditional request headers and returning
+                the result (or NOT_MODIFIED) together with the response headers
+            force_refresh: Skip the cache lookup and refresh the entry
+            
+        Returns:
+            Cached or freshly fetched result
+        """
+        if self.cache is None or ttl is None:
+            return fetch({})[0]
+        
+        key = make_cache_key(key_url, params)
+        entry = None
+        if not force_refresh:
+            entry = self.cache.get_entry(key)
+            if entry is not None and entry['expires_at'] > time.time():
+                logger.debug("Cache hit: %s %s", key_url, params)
+                return entry['data']
+        
+        logger.debug("Cache miss: %s %s", key_url, params)
+        result, headers = fetch(conditional_headers(entry))
+        if result is NOT_MODIFIED:
+            self.cache.touch(key, ttl)
+            return entry['data']
+        
+        self.cache.set(
+            key,
+            result,
+            ttl,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified')
+        )
+        return result
+    
+    def _iter_cached(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        stream: Callable[[], Iterator[Any]],
+        field: Optional[str] = None
+    ) -> Iterator[Any]:
+        """Yield items from the cache, or stream them and cache them once complete.
+        
+        Items are stored under the same key _make_request uses for the
+        endpoint, so streaming and non-streaming calls share cache entries.
+        While caching, streamed items are collected until the stream ends; a
+        caller that stops early leaves the cache untouched.
+        
+        Args:
+            endpoint: API endpoint the stream reads
+            params: Query parameters (None values are dropped)
+            stream: Callable opening the request and yielding its items
+            field: Key of the item list in the cached response body, or None
+                if the body is the list itself
+            
+        Yields:
+            Items in response order
+        """
+        params = {k: v for k, v in params.items() if v is not None}
+        ttl = self._cache_ttl(endpoint, params)
+        if self.cache is None or ttl is None:
+            yield from stream()
+            return
+        
+        key_url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        key = make_cache_key(key_url, params)
+        entry = self.cache.get_entry(key)
+        if entry is not None and entry['expires_at'] > time.time():
+            logger.debug("Cache hit: %s %s", key_url, params)
+            data = entry['data']
+            yield from data if field is None else data[field]
+            return
+        
+        logger.debug("Cache miss: %s %s", key_url, params)
+        items = []
+        for item in stream():
+            items.append(item)
+            yield item
+        self.cache.set(key, items if field is None else {field: items}, ttl)
     
-    @sleep_and_retry
-    @limits(calls=1, period=1)  # Basic rate limiting
     def _make_request(
         self, 
         endpoint: str, 
         method: str = 'GET', 
         params: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        force_refresh: bool = False,
+        body: Optional[Any] = None
     ) -> Dict[str, Any]:
-        """Make an API request with rate limiting and error handling.
+        """Make an API request, serving cacheable GET requests from the cache.
         
         Args:
             endpoint: API endpoint to call
             method: HTTP method to use
-            params: Query parameters for the request
+            params: Query parameters for the request (None values are dropped)
             headers: Additional headers for the request
+            force_refresh: Bypass the cache and fetch a fresh response
+            body: Optional object sent as the JSON request body
             
         Returns:
             API response as a dictionary
@@ -47,22 +315,108 @@ class BaseAPIClient:
         Raises:
             requests.exceptions.RequestException: If the request fails
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        ttl = self._cache_ttl(endpoint, params) if method == 'GET' else None
+        return self._cached_call(
+            f"{self.base_url}/{endpoint.lstrip('/')}",
+            params,
+            ttl,
+            lambda validators: self._send_request(endpoint, method, params, {**(headers or {}), **validators}, body),
+            force_refresh=force_refresh
+        )
+    
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a rate-limited HTTP request, waiting out 429 responses.
+        
+        Each attempt takes a token from the client's bucket. When the server
+        still answers 429, the client sleeps for the interval given by the
+        Retry-After/RateLimit-Reset headers before trying again.
         
+        Args:
+            method: HTTP method to use
+            url: Full URL to call
+            **kwargs: Additional arguments for requests.Session.request
+            
+        Returns:
+            Successful response
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        kwargs.setdefault('timeout', self.DEFAULT_TIMEOUT)
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                headers=headers
-            )
+            for attempt in range(self.MAX_RATE_LIMIT_RETRIES):
+                self._bucket.acquire()
+                response = self.session.request(method=method, url=url, **kwargs)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "%s %s (Content-Encoding: %s)",
+                        response.status_code, url, response.headers.get('Content-Encoding')
+                    )
+                if response.status_code != 429 or attempt == self.MAX_RATE_LIMIT_RETRIES - 1:
+                    break
+                delay = retry_after(response.headers)
+                time.sleep(delay if delay is not None else 60.0 / self.calls_per_minute)
             response.raise_for_status()
-            return response.json()
+            return response
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"API request failed: {str(e)}")
+            logger.error("API request failed: %s", e)
             raise
     
+    def _send_request(
+        self, 
+        endpoint: str, 
+        method: str = 'GET', 
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[Any] = None
+    ) -> Tuple[Any, Mapping[str, str]]:
+        """Send an API request with rate limiting and error handling.
+        
+        Args:
+            endpoint: API endpoint to call
+            method: HTTP method to use
+            params: Query parameters for the request
+            headers: Additional headers for the request
+            body: Optional object sent as the JSON request body
+            
+        Returns:
+            Decoded JSON response (or NOT_MODIFIED on a 304) and the response headers
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        response = self._request(method, url, params=params, headers=headers, json=body)
+        if response.status_code == 304:
+            return NOT_MODIFIED, response.headers
+        return loads(response.content), response.headers
+    
+    def map(
+        self,
+        method: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_workers: Optional[int] = None
+    ) -> List[Any]:
+        """Call a client method for each item concurrently over the pooled session.
+        
+        Requests still pass through the client's rate limiter, so throughput is
+        bounded by the provider's quota rather than by round-trip latency.
+        
+        Args:
+            method: Bound client method taking a single item (e.g. ``client.get_company_overview``)
+            items: Items to pass to the method, typically symbols
+            max_workers: Maximum number of worker threads (defaults to the rate limit,
+                capped at the connection pool size)
+            
+        Returns:
+            Results in the same order as the items
+        """
+        workers = max_workers or min(self.calls_per_minute, self.POOL_MAXSIZE)
+        return map_concurrently(method, items, workers)
+    
     def _validate_response(self, response: Dict[str, Any]) -> bool:
         """Validate the API response.
         
@@ -75,5 +429,10 @@ class BaseAPIClient:
         return bool(response)  # Basic validation, override in subclasses
     
     def close(self):
-        """Close the session."""
+        """Close the session and release the shared instance, if this is one."""
+        key = getattr(self, '_shared_key', None)
+        if key is not None:
+            with _shared_clients_lock:
+                if _shared_clients.get(key) is self:
+                    del _shared_clients[key]
         self.session.close() 
\ No newline at end of file
@@ -0,0 +1,338 @@
+"""Response caching for API toolkits."""
+import asyncio
+import functools
+import hashlib
+import itertools
+import json
+import math
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, TypeVar
+from .json_utils import dumps, loads
+
+# Returned by fetch callables when the server answers 304 Not Modified
+NOT_MODIFIED = object()
+
+FuncT = TypeVar('FuncT', bound=Callable[..., Any])
+
+
+def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Build If-None-Match/If-Modified-Since headers from a cache entry.
+
+    Args:
+        entry: Cache entry as returned by ResponseCache.get_entry
+
+    Returns:
+        Conditional request headers (empty if the entry has no validators)
+    """
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def make_cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Build a stable cache key for a request.
+
+    Args:
+        url: Full request URL
+        params: Query parameters (the API key is excluded from the key)
+
+    Returns:
+        MD5 hex digest identifying the request
+    """
+    params = {k: v for k, v in (params or {}).items() if k != 'apikey'}
+    payload = json.dumps({'u': url, 'p': params}, sort_keys=True, default=str)
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """In-memory LRU cache with a per-entry time-to-live.
+
+    Expired entries that carry an ETag or Last-Modified validator are kept so
+    they can be revalidated with a conditional request.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the least recently used
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the raw entry for a key, even if it has expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Dictionary with 'data', 'expires_at', 'etag' and 'last_modified', or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry['expires_at'] <= time.time() and not (entry.get('etag') or entry.get('last_modified')):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        entry = self.get_entry(key)
+        if entry is None or entry['expires_at'] <= time.time():
+            return None
+        return entry['data']
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store a value for a key.
+
+        Args:
+            key: Cache key
+            value: Value to cache (must be JSON serializable for file-backed caches)
+            ttl: Time-to-live in seconds
+            etag: Optional ETag response header used for revalidation
+            last_modified: Optional Last-Modified response header used for revalidation
+        """
+        with self._lock:
+            self._entries[key] = {
+                'expires_at': time.time() + ttl,
+                'data': value,
+                'etag': etag,
+                'last_modified': last_modified
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def touch(self, key: str, ttl: float) -> None:
+        """Extend the lifetime of an entry after a successful revalidation.
+
+        Args:
+            key: Cache key
+            ttl: New time-to-live in seconds
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry['expires_at'] = time.time() + ttl
+
+    def delete(self, key: str) -> None:
+        """Remove a key from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCache(ResponseCache):
+    """File-backed cache storing one JSON document per entry.
+
+    Entries are written to ``<root>/<namespace>/<key>.json`` so cached responses
+    survive interpreter restarts.
+    """
+
+    DEFAULT_ROOT = os.path.join(os.path.expanduser('~'), '.api_toolkits', 'cache')
+
+    def __init__(self, namespace: str, root: Optional[str] = None):
+        """Initialize the cache.
+
+        Args:
+            namespace: Subdirectory for this cache, usually the client name
+            root: Base directory (defaults to ~/.api_toolkits/cache)
+        """
+        super().__init__()
+        self.directory = os.path.join(root or self.DEFAULT_ROOT, namespace)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _write(self, key: str, entry: Dict[str, Any]) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(dumps(entry))
+        os.replace(tmp_path, path)
+
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                entry = loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if entry.get('expires_at', 0) <= time.time() and not (entry.get('etag') or entry.get('last_modified')):
+            self.delete(key)
+            return None
+        return entry
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        self._write(key, {
+            'expires_at': time.time() + ttl,
+            'data': value,
+            'etag': etag,
+            'last_modified': last_modified
+        })
+
+    def touch(self, key: str, ttl: float) -> None:
+        entry = self.get_entry(key)
+        if entry is not None:
+            entry['expires_at'] = time.time() + ttl
+            self._write(key, entry)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                self.delete(name[:-5])
+
+
+# Object -> token used in place of its repr when memoizing calls on it. Tokens
+# are never reused, so a new object that recycles a freed id gets a fresh key.
+_identity_tokens: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+_token_counter = itertools.count()
+_token_lock = threading.Lock()
+
+def _key_arg(value: Any) -> Any:
+    """Return a stable, identity-safe stand-in for a memoized call argument.
+
+    Plain data (strings, numbers, lists, dicts, ...) is keyed by value; any other
+    object, such as a client instance, is keyed by a per-object token.
+    """
+    if value is None or isinstance(value, (str, int, float, bool, list, tuple, dict)):
+        return value
+    try:
+        with _token_lock:
+            token = _identity_tokens.get(value)
+            if token is None:
+                token = _identity_tokens[value] = next(_token_counter)
+    except TypeError:
+        return repr(value)
+    return f"<{type(value).__qualname__}#{token}>"
+
+
+def ttl_lru_cache(seconds: float, maxsize: int = 256) -> Callable[[FuncT], FuncT]:
+    """Memoize a function or coroutine function in memory for a few seconds.
+
+    Calls are keyed by their arguments (including ``self`` for methods), so
+    repeating a call within ``seconds`` returns the earlier result without a
+    request. Objects other than plain data, such as ``self``, are keyed by
+    identity. For coroutine functions the running task is cached per event loop,
+    so concurrent identical calls share one request; failed or cancelled tasks
+    evict themselves. With ``seconds=0`` a coroutine's task is only shared while
+    it is in flight, which coalesces concurrent calls without adding a second
+    cache layer in front of a client's response cache; plain functions are then
+    not cached at all. The original function stays available as
+    ``__wrapped__`` and ``cache_clear()`` empties the cache.
+
+    Args:
+        seconds: How long a result is reused (0 to share in-flight tasks only)
+        maxsize: Maximum number of results kept before evicting the least recently used
+
+    Returns:
+        Decorator applying the cache
+    """
+    def decorator(func: FuncT) -> FuncT:
+        def cache_key(args: tuple, kwargs: Dict[str, Any]) -> str:
+            return make_cache_key(func.__qualname__, {
+                'args': [_key_arg(arg) for arg in args],
+                'kwargs': {name: _key_arg(value) for name, value in kwargs.items()}
+            })
+
+        if asyncio.iscoroutinefunction(func):
+            # Tasks are bound to the loop that created them, so each loop gets its own cache
+            loop_caches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ResponseCache]" = (
+                weakref.WeakKeyDictionary()
+            )
+            loop_caches_lock = threading.Lock()
+
+            def loop_cache() -> ResponseCache:
+                loop = asyncio.get_running_loop()
+                with loop_caches_lock:
+                    cache = loop_caches.get(loop)
+                    if cache is None:
+                        cache = loop_caches[loop] = ResponseCache(maxsize)
+                    return cache
+
+            def evict(cache: ResponseCache, key: str, task: asyncio.Future) -> None:
+                if seconds <= 0 or task.cancelled() or task.exception() is not None:
+                    entry = cache.get_entry(key)
+                    if entry is not None and entry['data'] is task:
+                        cache.delete(key)
+
+            @functools.wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                cache = loop_cache()
+                key = cache_key(args, kwargs)
+                task = cache.get(key)
+                if task is None:
+                    task = asyncio.ensure_future(func(*args, **kwargs))
+                    cache.set(key, task, seconds if seconds > 0 else math.inf)
+                    task.add_done_callback(functools.partial(evict, cache, key))
+                return await asyncio.shield(task)
+
+            def cache_clear() -> None:
+                with loop_caches_lock:
+                    caches = list(loop_caches.values())
+                for cache in caches:
+                    cache.clear()
+        else:
+            cache = ResponseCache(maxsize)
+            cache_clear = cache.clear
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if seconds <= 0:
+                    return func(*args, **kwargs)
+                key = cache_key(args, kwargs)
+                entry = cache.get_entry(key)
+                if entry is not None and entry['expires_at'] > time.time():
+                    return entry['data']
+                result = func(*args, **kwargs)
+                cache.set(key, result, seconds)
+                return result
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -2,8 +2,10 @@
 import os
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file once per process
+if not os.environ.get('_APITOOLKITS_ENV_LOADED'):
+    load_dotenv()
+    os.environ['_APITOOLKITS_ENV_LOADED'] = '1'
 
 class APIConfig:
     """Base configuration class for API settings."""
@@ -1,4 +1,5 @@
 """Finnhub API toolkit."""
-from .fh_client import FinnhubClient
+from .fh_client import FinnhubClient, get_finnhub
+from .fh_async_client import AsyncFinnhubClient
 
-__all__ = ['FinnhubClient'] 
\ No newline at end of file
+__all__ = ['FinnhubClient', 'AsyncFinnhubClient', 'get_finnhub']
\ No newline at end of file
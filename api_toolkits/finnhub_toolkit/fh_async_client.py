@@ -0,0 +1,342 @@
+"""Async Finnhub API client implementation."""
+from typing import Dict, Any, Optional, List, Union, AsyncIterator
+from datetime import datetime
+import aiohttp
+from ..async_base_client import AsyncBaseAPIClient
+from ..cache import ResponseCache, ttl_lru_cache
+from ..config import APIConfig
+from .fh_client import FinnhubClient, _to_ts, _to_str, ijson
+
+class AsyncFinnhubClient(AsyncBaseAPIClient):
+    """Asyncio client for interacting with the Finnhub REST API.
+
+    Exposes ``async def`` versions of the FinnhubClient endpoints so many
+    symbols can be fetched concurrently, e.g.::
+
+        async with AsyncFinnhubClient() as client:
+            quotes = await client.gather(client.get_quote(s) for s in symbols)
+    """
+
+    DEFAULT_CACHE_TTLS = FinnhubClient.DEFAULT_CACHE_TTLS
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, int]] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        """Initialize the async Finnhub client.
+
+        Args:
+            api_key: Optional API key (will use environment variable if not provided)
+            max_concurrency: Maximum number of requests in flight
+            cache: Optional response cache (caching is disabled if not provided)
+            cache_ttls: Optional TTL overrides in seconds, keyed by REST endpoint
+            session: Optional session shared with other clients (not closed by close())
+        """
+        api_key = api_key or APIConfig.FINNHUB_API_KEY
+        if not api_key:
+            raise ValueError("Finnhub API key is required")
+
+        super().__init__(
+            api_key=api_key,
+            base_url=APIConfig.FINNHUB_BASE_URL,
+            calls_per_minute=APIConfig.FINNHUB_RATE_LIMIT,
+            max_concurrency=max_concurrency,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            session=session
+        )
+
+    def _session_headers(self) -> Dict[str, str]:
+        """Authenticate every request with the Finnhub token header."""
+        return {'X-Finnhub-Token': self.api_key, 'Accept': 'application/json'}
+
+    async def get_stock_candles(
+        self,
+        symbol: str,
+        resolution: str = 'D',
+        from_date: Union[int, datetime, str] = None,
+        to_date: Union[int, datetime, str] = None
+    ) -> Dict[str, Any]:
+        """Get candlestick data for stocks.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            resolution: Supported resolution includes: 1, 5, 15, 30, 60, D, W, M
+            from_date: UNIX timestamp, datetime, or YYYY-MM-DD string
+            to_date: UNIX timestamp, datetime, or YYYY-MM-DD string
+
+        Returns:
+            Candlestick data
+        """
+        return await self._make_request('stock/candle', params={
+            'symbol': symbol,
+            'resolution': resolution,
+            'from': _to_ts(from_date),
+            'to': _to_ts(to_date)
+        })
+
+    async def get_company_profile(
+        self,
+        symbol: Optional[str] = None,
+        isin: Optional[str] = None,
+        cusip: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get general information of a company.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            isin: ISIN identifier
+            cusip: CUSIP identifier
+
+        Returns:
+            Company profile data
+        """
+        return await self._make_request('stock/profile2', params={
+            'symbol': symbol,
+            'isin': isin,
+            'cusip': cusip
+        })
+
+    @ttl_lru_cache(0)
+    async def get_quote(self, symbol: str) -> Dict[str, Any]:
+        """Get real-time quote data.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+
+        Returns:
+            Real-time quote data
+        """
+        return await self._make_request('quote', params={'symbol': symbol})
+
+    async def get_company_news(
+        self,
+        symbol: str,
+        from_date: Union[str, datetime],
+        to_date: Union[str, datetime]
+    ) -> List[Dict[str, Any]]:
+        """Get company news.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            from_date: From date (YYYY-MM-DD) or datetime
+            to_date: To date (YYYY-MM-DD) or datetime
+
+        Returns:
+            List of news items
+        """
+        return await self._make_request('company-news', params={
+            'symbol': symbol,
+            'from': _to_str(from_date),
+            'to': _to_str(to_date)
+        })
+
+    async def iter_company_news(
+        self,
+        symbol: str,
+        from_date: Union[str, datetime],
+        to_date: Union[str, datetime]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over company news while the response downloads.
+
+        Streams and caches like FinnhubClient.iter_company_news and falls back
+        to get_company_news when ijson is missing.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            from_date: From date (YYYY-MM-DD) or datetime
+            to_date: To date (YYYY-MM-DD) or datetime
+
+        Yields:
+            News items, most recent first
+        """
+        if ijson is None:
+            for article in await self.get_company_news(symbol, from_date, to_date):
+                yield article
+            return
+
+        params = {'symbol': symbol, 'from': _to_str(from_date), 'to': _to_str(to_date)}
+
+        async def stream() -> AsyncIterator[Dict[str, Any]]:
+            async with self._stream('company-news', params) as body:
+                async for article in ijson.items(body, 'item', use_float=True):
+                    yield article
+
+        async for article in self._iter_cached('company-news', params, stream):
+            yield article
+
+    async def get_company_peers(self, symbol: str) -> List[str]:
+        """Get company peers.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+
+        Returns:
+            List of peer symbols
+        """
+        return await self._make_request('stock/peers', params={'symbol': symbol})
+
+    async def get_price_target(self, symbol: str) -> Dict[str, Any]:
+        """Get latest price target consensus.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+
+        Returns:
+            Price target data
+        """
+        return await self._make_request('stock/price-target', params={'symbol': symbol})
+
+    async def get_earnings_calendar(
+        self,
+        from_date: Union[str, datetime],
+        to_date: Union[str, datetime],
+        symbol: str = "",
+        international: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get earnings calendar.
+
+        Args:
+            from_date: From date (YYYY-MM-DD) or datetime
+            to_date: To date (YYYY-MM-DD) or datetime
+            symbol: Symbol to filter by
+            international: Include international markets
+
+        Returns:
+            List of earnings calendar events
+        """
+        return await self._make_request('calendar/earnings', params={
+            'from': _to_str(from_date),
+            'to': _to_str(to_date),
+            'symbol': symbol,
+            'international': str(international).lower()
+        })
+
+    async def get_recommendation_trends(self, symbol: str) -> List[Dict[str, Any]]:
+        """Get recommendation trends for a symbol.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+
+        Returns:
+            List of recommendation trends
+        """
+        return await self._make_request('stock/recommendation', params={'symbol': symbol})
+
+    async def get_stock_symbols(self, exchange: str = 'US') -> List[Dict[str, Any]]:
+        """Get list of stocks.
+
+        Args:
+            exchange: Exchange code (e.g., 'US' for US exchanges)
+
+        Returns:
+            List of stocks
+        """
+        return await self._make_request('stock/symbol', params={'exchange': exchange})
+
+    async def get_company_earnings(self, symbol: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get company earnings data.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            limit: Number of periods to return
+
+        Returns:
+            List of earnings data
+        """
+        return await self._make_request('stock/earnings', params={'symbol': symbol, 'limit': limit})
+
+    async def get_company_financials(
+        self,
+        symbol: str,
+        statement: str = 'bs',
+        freq: str = 'annual'
+    ) -> Dict[str, Any]:
+        """Get company financial statements.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            statement: Statement type ('bs'=Balance Sheet, 'ic'=Income Statement, 'cf'=Cash Flow)
+            freq: Frequency ('annual' or 'quarterly')
+
+        Returns:
+            Financial statement data
+        """
+        return await self._make_request('stock/financials', params={
+            'symbol': symbol,
+            'statement': statement,
+            'freq': freq
+        })
+
+    async def get_market_news(self, category: str = 'general', min_id: int = 0) -> List[Dict[str, Any]]:
+        """Get market news.
+
+        Args:
+            category: News category ('general', 'forex', 'crypto', 'merger')
+            min_id: Get news after this ID
+
+        Returns:
+            List of news items
+        """
+        return await self._make_request('news', params={'category': category, 'minId': min_id})
+
+    async def get_ipo_calendar(
+        self,
+        from_date: Union[str, datetime],
+        to_date: Union[str, datetime]
+    ) -> Dict[str, Any]:
+        """Get IPO calendar.
+
+        Args:
+            from_date: From date (YYYY-MM-DD) or datetime
+            to_date: To date (YYYY-MM-DD) or datetime
+
+        Returns:
+            IPO calendar data
+        """
+        return await self._make_request('calendar/ipo', params={
+            'from': _to_str(from_date),
+            'to': _to_str(to_date)
+        })
+
+    async def get_earnings_estimates(
+        self,
+        symbol: str,
+        freq: str = 'quarterly'
+    ) -> Dict[str, Any]:
+        """Get company's EPS estimates.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            freq: Frequency ('annual' or 'quarterly')
+
+        Returns:
+            EPS estimates data
+        """
+        return await self._make_request('stock/eps-estimate', params={'symbol': symbol, 'freq': freq})
+
+    async def get_stock_dividends(
+        self,
+        symbol: str,
+        from_date: Union[str, datetime],
+        to_date: Union[str, datetime]
+    ) -> List[Dict[str, Any]]:
+        """Get dividend history for a stock.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            from_date: From date (YYYY-MM-DD) or datetime
+            to_date: To date (YYYY-MM-DD) or datetime
+
+        Returns:
+            List of dividend events
+        """
+        return await self._make_request('stock/dividend', params={
+            'symbol': symbol,
+            'from': _to_str(from_date),
+            'to': _to_str(to_date)
+        })
@@ -1,23 +1,80 @@
-"""Finnhub API client implementation using official Python client."""
-from typing import Dict, Any, Optional, List, Union
-import finnhub
+"""Finnhub API client implementation."""
+from typing import Dict, Any, Optional, List, Union, Iterator
+import functools
 from datetime import datetime
+from ..base_client import BaseAPIClient, get_shared_client
+from ..cache import ResponseCache
 from ..config import APIConfig
 
-class FinnhubClient:
-    """Client for interacting with the Finnhub API using official client."""
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+@functools.lru_cache(maxsize=1024)
+def _to_ts(value: Union[int, datetime, str, None]) -> Optional[int]:
+    """Convert a datetime or YYYY-MM-DD string to a UNIX timestamp.
+    
+    Memoized because fan-out over many symbols usually shares one date range.
+    """
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, str):
+        return int(datetime.strptime(value, "%Y-%m-%d").timestamp())
+    return value
+
+@functools.lru_cache(maxsize=1024)
+def _to_str(value: Union[str, datetime]) -> str:
+    """Convert a datetime to a YYYY-MM-DD string."""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    return value
+
+class FinnhubClient(BaseAPIClient):
+    """Client for interacting with the Finnhub REST API."""
+    
+    # Cache TTLs in seconds, keyed by REST endpoint
+    DEFAULT_CACHE_TTLS = {
+        'stock/profile2': 604800,
+        'stock/symbol': 86400,
+        'stock/peers': 86400,
+        'stock/financials': 86400,
+        'stock/earnings': 86400,
+        'stock/eps-estimate': 86400,
+        'stock/recommendation': 3600,
+        'stock/price-target': 3600,
+        'company-news': 300,
+        'quote': 10,
+    }
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, int]] = None
+    ):
         """Initialize the Finnhub client.
         
         Args:
             api_key: Optional API key (will use environment variable if not provided)
+            cache: Optional response cache (caching is disabled if not provided)
+            cache_ttls: Optional TTL overrides in seconds, keyed by REST endpoint
         """
-        self.api_key = api_key or APIConfig.FINNHUB_API_KEY
-        if not self.api_key:
+        api_key = api_key or APIConfig.FINNHUB_API_KEY
+        if not api_key:
             raise ValueError("Finnhub API key is required")
             
-        self.client = finnhub.Client(api_key=self.api_key)
+        super().__init__(
+            api_key=api_key,
+            base_url=APIConfig.FINNHUB_BASE_URL,
+            calls_per_minute=APIConfig.FINNHUB_RATE_LIMIT,
+            cache=cache,
+            cache_ttls=cache_ttls
+        )
+        self.session.headers.update({
+            'X-Finnhub-Token': self.api_key,
+            'Accept': 'application/json'
+        })
     
     def get_stock_candles(
         self,
@@ -37,18 +94,12 @@ class FinnhubClient:
         Returns:
             Candlestick data
         """
-        # Convert datetime to timestamp if needed
-        if isinstance(from_date, datetime):
-            from_date = int(from_date.timestamp())
-        elif isinstance(from_date, str):
-            from_date = int(datetime.strptime(from_date, "%Y-%m-%d").timestamp())
-            
-        if isinstance(to_date, datetime):
-            to_date = int(to_date.timestamp())
-        elif isinstance(to_date, str):
-            to_date = int(datetime.strptime(to_date, "%Y-%m-%d").timestamp())
-            
-        return self.client.stock_candles(symbol, resolution, from_date, to_date)
+        return self._make_request('stock/candle', params={
+            'symbol': symbol,
+            'resolution': resolution,
+            'from': _to_ts(from_date),
+            'to': _to_ts(to_date)
+        })
     
     def get_company_profile(self, symbol: Optional[str] = None, isin: Optional[str] = None, cusip: Optional[str] = None) -> Dict[str, Any]:
         """Get general information of a company.
@@ -61,7 +112,11 @@ class FinnhubClient:
         Returns:
             Company profile data
         """
-        return self.client.company_profile2(symbol=symbol, isin=isin, cusip=cusip)
+        return self._make_request('stock/profile2', params={
+            'symbol': symbol,
+            'isin': isin,
+            'cusip': cusip
+        })
     
     def get_quote(self, symbol: str) -> Dict[str, Any]:
         """Get real-time quote data.
@@ -72,7 +127,19 @@ class FinnhubClient:
         Returns:
             Real-time quote data
         """
-        return self.client.quote(symbol)
+        return self._make_request('quote', params={'symbol': symbol})
+    
+    def get_quotes(self, symbols: List[str], max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Get real-time quotes for several symbols concurrently.
+        
+        Args:
+            symbols: Stock symbols (e.g., ['AAPL', 'MSFT'])
+            max_workers: Maximum number of worker threads
+            
+        Returns:
+            Real-time quote data keyed by symbol
+        """
+        return dict(zip(symbols, self.map(self.get_quote, symbols, max_workers)))
     
     def get_company_news(
         self,
@@ -90,13 +157,46 @@ class FinnhubClient:
         Returns:
             List of news items
         """
-        # Convert datetime to string if needed
-        if isinstance(from_date, datetime):
-            from_date = from_date.strftime("%Y-%m-%d")
-        if isinstance(to_date, datetime):
-            to_date = to_date.strftime("%Y-%m-%d")
+        return self._make_request('company-news', params={
+            'symbol': symbol,
+            'from': _to_str(from_date),
+            'to': _to_str(to_date)
+        })
+    
+    def iter_company_news(
+        self,
+        symbol: str,
+        from_date: Union[str, datetime],
+        to_date: Union[str, datetime]
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over company news while the response downloads.
+        
+        With ijson installed the response is parsed incrementally, so callers
+        that only need the first few articles never decode the rest. With a
+        cache, a fresh entry is served without a request and a fully consumed
+        stream is cached, which keeps every article in memory until the end.
+        Without ijson this falls back to get_company_news.
+        
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            from_date: From date (YYYY-MM-DD) or datetime
+            to_date: To date (YYYY-MM-DD) or datetime
             
-        return self.client.company_news(symbol, _from=from_date, to=to_date)
+        Yields:
+            News items, most recent first
+        """
+        if ijson is None:
+            yield from self.get_company_news(symbol, from_date, to_date)
+            return
+        
+        params = {'symbol': symbol, 'from': _to_str(from_date), 'to': _to_str(to_date)}
+        
+        def stream() -> Iterator[Dict[str, Any]]:
+            with self._request('GET', f"{self.base_url}/company-news", params=params, stream=True) as response:
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, 'item', use_float=True)
+        
+        yield from self._iter_cached('company-news', params, stream)
     
     def get_company_peers(self, symbol: str) -> List[str]:
         """Get company peers.
@@ -107,7 +207,7 @@ class FinnhubClient:
         Returns:
             List of peer symbols
         """
-        return self.client.company_peers(symbol)
+        return self._make_request('stock/peers', params={'symbol': symbol})
     
     def get_price_target(self, symbol: str) -> Dict[str, Any]:
         """Get latest price target consensus.
@@ -118,7 +218,7 @@ class FinnhubClient:
         Returns:
             Price target data
         """
-        return self.client.price_target(symbol)
+        return self._make_request('stock/price-target', params={'symbol': symbol})
     
     def get_earnings_calendar(
         self,
@@ -138,17 +238,12 @@ class FinnhubClient:
         Returns:
             List of earnings calendar events
         """
-        if isinstance(from_date, datetime):
-            from_date = from_date.strftime("%Y-%m-%d")
-        if isinstance(to_date, datetime):
-            to_date = to_date.strftime("%Y-%m-%d")
-            
-        return self.client.earnings_calendar(
-            _from=from_date,
-            to=to_date,
-            symbol=symbol,
-            international=international
-        )
+        return self._make_request('calendar/earnings', params={
+            'from': _to_str(from_date),
+            'to': _to_str(to_date),
+            'symbol': symbol,
+            'international': str(international).lower()
+        })
     
     def get_recommendation_trends(self, symbol: str) -> List[Dict[str, Any]]:
         """Get recommendation trends for a symbol.
@@ -159,7 +254,7 @@ class FinnhubClient:
         Returns:
             List of recommendation trends
         """
-        return self.client.recommendation_trends(symbol)
+        return self._make_request('stock/recommendation', params={'symbol': symbol})
     
     def get_stock_symbols(self, exchange: str = 'US') -> List[Dict[str, Any]]:
         """Get list of stocks.
@@ -170,7 +265,7 @@ class FinnhubClient:
         Returns:
             List of stocks
         """
-        return self.client.stock_symbols(exchange)
+        return self._make_request('stock/symbol', params={'exchange': exchange})
     
     def get_company_earnings(self, symbol: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Get company earnings data.
@@ -182,7 +277,7 @@ class FinnhubClient:
         Returns:
             List of earnings data
         """
-        return self.client.company_earnings(symbol, limit)
+        return self._make_request('stock/earnings', params={'symbol': symbol, 'limit': limit})
     
     def get_company_financials(
         self,
@@ -200,7 +295,11 @@ class FinnhubClient:
         Returns:
             Financial statement data
         """
-        return self.client.financials(symbol, statement, freq)
+        return self._make_request('stock/financials', params={
+            'symbol': symbol,
+            'statement': statement,
+            'freq': freq
+        })
     
     def get_market_news(self, category: str = 'general', min_id: int = 0) -> List[Dict[str, Any]]:
         """Get market news.
@@ -212,7 +311,7 @@ class FinnhubClient:
         Returns:
             List of news items
         """
-        return self.client.general_news(category, min_id=min_id)
+        return self._make_request('news', params={'category': category, 'minId': min_id})
     
     def get_ipo_calendar(
         self,
@@ -228,12 +327,10 @@ class FinnhubClient:
         Returns:
             IPO calendar data
         """
-        if isinstance(from_date, datetime):
-            from_date = from_date.strftime("%Y-%m-%d")
-        if isinstance(to_date, datetime):
-            to_date = to_date.strftime("%Y-%m-%d")
-            
-        return self.client.ipo_calendar(_from=from_date, to=to_date)
+        return self._make_request('calendar/ipo', params={
+            'from': _to_str(from_date),
+            'to': _to_str(to_date)
+        })
     
     def get_earnings_estimates(
         self,
@@ -249,7 +346,7 @@ class FinnhubClient:
         Returns:
             EPS estimates data
         """
-        return self.client.company_eps_estimates(symbol, freq)
+        return self._make_request('stock/eps-estimate', params={'symbol': symbol, 'freq': freq})
     
     def get_stock_dividends(
         self,
@@ -267,14 +364,20 @@ class FinnhubClient:
         Returns:
             List of dividend events
         """
-        if isinstance(from_date, datetime):
-            from_date = from_date.strftime("%Y-%m-%d")
-        if isinstance(to_date, datetime):
-            to_date = to_date.strftime("%Y-%m-%d")
-            
-        return self.client.stock_dividends(symbol, _from=from_date, to=to_date)
+        return self._make_request('stock/dividend', params={
+            'symbol': symbol,
+            'from': _to_str(from_date),
+            'to': _to_str(to_date)
+        })
+
+
+def get_finnhub(api_key: Optional[str] = None) -> FinnhubClient:
+    """Return the shared FinnhubClient for an API key.
     
-    def close(self):
-        """Close the client session."""
-        # No explicit close needed for finnhub client
-        pass 
\ No newline at end of file
+    Args:
+        api_key: Optional API key (will use environment variable if not provided)
+        
+    Returns:
+        Shared client instance (closing it invalidates the shared instance)
+    """
+    return get_shared_client(FinnhubClient, api_key)
@@ -0,0 +1,96 @@
+"""JSON helpers using orjson when available."""
+import json
+import sys
+from typing import Any, BinaryIO, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumpb(data: Any, indent: Optional[int] = None) -> bytes:
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(data, indent=indent, default=str).encode()
+
+
+def dumps(data: Any, indent: Optional[int] = None) -> str:
+    """Encode an object as a JSON string.
+
+    orjson only supports two-space indentation, so other indents fall back to
+    the standard library. Values that are not JSON types are encoded with str().
+
+    Args:
+        data: Object to encode
+        indent: Optional indentation width for pretty printing
+
+    Returns:
+        JSON document as str
+    """
+    return _dumpb(data, indent).decode()
+
+
+def write_json(data: Any, indent: Optional[int] = 2, stream: Optional[BinaryIO] = None) -> None:
+    """Write an object as JSON to a binary stream.
+
+    Lists are encoded and written one element at a time, so printing a large
+    listing never builds the whole pretty-printed document in memory.
+
+    Args:
+        data: Object to write
+        indent: Optional indentation width for pretty printing
+        stream: Binary stream to write to (defaults to stdout)
+    """
+    if stream is None:
+        if not hasattr(sys.stdout, 'buffer'):
+            print(dumps(data, indent=indent))
+            return
+        sys.stdout.flush()
+        stream = sys.stdout.buffer
+
+    if isinstance(data, list):
+        stream.write(b'[')
+        for i, row in enumerate(data):
+            stream.write(b',\n' if i else b'\n')
+            stream.write(_dumpb(row, indent))
+        stream.write(b'\n]\n' if data else b']\n')
+    else:
+        stream.write(_dumpb(data, indent))
+        stream.write(b'\n')
+    stream.flush()
+
+
+def write_section(title: str, data: Any, indent: Optional[int] = 2, stream: Optional[BinaryIO] = None) -> None:
+    """Write a blank line, a title line and an object as JSON in a single write.
+
+    Args:
+        title: Heading printed above the data
+        data: Object to write
+        indent: Optional indentation width for pretty printing
+        stream: Binary stream to write to (defaults to stdout)
+    """
+    if stream is None:
+        if not hasattr(sys.stdout, 'buffer'):
+            print(f"\n{title}\n{dumps(data, indent=indent)}")
+            return
+        sys.stdout.flush()
+        stream = sys.stdout.buffer
+
+    stream.write(b''.join((f"\n{title}\n".encode(), _dumpb(data, indent), b'\n')))
+    stream.flush()
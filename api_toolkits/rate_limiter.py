@@ -0,0 +1,126 @@
+"""Rate limiting primitives for API toolkits."""
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Hashable, Mapping, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    The bucket starts full, so callers may burst up to ``capacity`` requests and
+    are then paced at ``refill_rate`` tokens per second.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """Initialize the bucket.
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, calls_per_minute: int) -> 'TokenBucket':
+        """Create a bucket allowing ``calls_per_minute`` calls per minute."""
+        return cls(capacity=calls_per_minute, refill_rate=calls_per_minute / 60.0)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """Take tokens if enough are available.
+
+        Args:
+            tokens: Number of tokens to take (clamped to 0..capacity)
+
+        Returns:
+            0 if the tokens were taken, otherwise the seconds until they are available
+        """
+        tokens = min(max(tokens, 0), self.capacity)
+        with self._lock:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+            return (tokens - self.tokens) / self.refill_rate
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Block until enough tokens are available and take them."""
+        while True:
+            wait = self.try_acquire(tokens)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1) -> None:
+        """Wait without blocking the event loop until enough tokens are available and take them."""
+        while True:
+            wait = self.try_acquire(tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+_shared_buckets: Dict[Hashable, TokenBucket] = {}
+_shared_buckets_lock = threading.Lock()
+
+
+def shared_bucket(key: Hashable, calls_per_minute: int) -> TokenBucket:
+    """Return the process-wide bucket for a key, creating it on first use.
+
+    Provider quotas apply per API key, so every client using the same key,
+    sync or async, should draw from one bucket.
+
+    Args:
+        key: Identifies the quota, e.g. ``(base_url, api_key)``
+        calls_per_minute: Rate used if the bucket has to be created
+
+    Returns:
+        Shared token bucket
+    """
+    with _shared_buckets_lock:
+        bucket = _shared_buckets.get(key)
+        if bucket is None:
+            bucket = _shared_buckets[key] = TokenBucket.per_minute(calls_per_minute)
+        return bucket
+
+
+def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Return the delay requested by a rate-limited response, if any.
+
+    Understands ``Retry-After`` (seconds or HTTP date) and ``RateLimit-Reset``
+    (seconds until the window resets).
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds to wait, or None if the server did not say
+    """
+    value = headers.get('Retry-After')
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    value = headers.get('RateLimit-Reset')
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+    return None
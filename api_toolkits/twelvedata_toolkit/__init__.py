@@ -1,4 +1,5 @@
 """TwelveData API toolkit."""
-from .td_client import TwelveDataClient
+from .td_client import TwelveDataClient, get_twelvedata
+from .td_async_client import AsyncTwelveDataClient
 
-__all__ = ['TwelveDataClient'] 
\ No newline at end of file
+__all__ = ['TwelveDataClient', 'AsyncTwelveDataClient', 'get_twelvedata'] 
\ No newline at end of file
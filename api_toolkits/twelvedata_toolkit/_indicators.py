@@ -0,0 +1,89 @@
+"""Technical indicators over NumPy price arrays.
+
+The loops are compiled with numba when it is installed (see _njit.py) and
+run as plain Python otherwise. Inputs are float64 arrays in chronological
+order; outputs have the same length, with NaN where the window is not yet full.
+"""
+import numpy as np
+from ._njit import njit
+
+
+@njit(cache=True)
+def sma(values: np.ndarray, length: int) -> np.ndarray:
+    """Simple moving average.
+
+    Args:
+        values: Prices in chronological order
+        length: Window length
+
+    Returns:
+        Moving average of the last ``length`` values at each point
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    for i in range(n):
+        total += values[i]
+        if i >= length:
+            total -= values[i - length]
+        if i >= length - 1:
+            out[i] = total / length
+    return out
+
+
+@njit(cache=True)
+def ema(values: np.ndarray, length: int) -> np.ndarray:
+    """Exponential moving average, seeded with the SMA of the first window.
+
+    Args:
+        values: Prices in chronological order
+        length: Window length (smoothing factor is 2 / (length + 1))
+
+    Returns:
+        Exponential moving average at each point
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    if n < length:
+        return out
+    alpha = 2.0 / (length + 1)
+    prev = values[:length].mean()
+    out[length - 1] = prev
+    for i in range(length, n):
+        prev = alpha * values[i] + (1.0 - alpha) * prev
+        out[i] = prev
+    return out
+
+
+@njit(cache=True)
+def rsi(values: np.ndarray, length: int = 14) -> np.ndarray:
+    """Relative strength index with Wilder's smoothing.
+
+    Args:
+        values: Prices in chronological order
+        length: Lookback period
+
+    Returns:
+        RSI between 0 and 100 at each point
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    if n <= length:
+        return out
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, length + 1):
+        change = values[i] - values[i - 1]
+        if change > 0:
+            gain += change
+        else:
+            loss -= change
+    gain /= length
+    loss /= length
+    for i in range(length, n):
+        if i > length:
+            change = values[i] - values[i - 1]
+            gain = (gain * (length - 1) + max(change, 0.0)) / length
+            loss = (loss * (length - 1) + max(-change, 0.0)) / length
+        out[i] = 100.0 if loss == 0 else 100.0 - 100.0 / (1.0 + gain / loss)
+    return out
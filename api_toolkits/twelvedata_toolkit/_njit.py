@@ -0,0 +1,18 @@
+"""Optional numba JIT compilation for indicator kernels."""
+from typing import Any, Callable
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args: Any, **kwargs: Any) -> Callable:
+        """No-op stand-in for numba.njit when numba is not installed.
+
+        Supports both ``@njit`` and ``@njit(cache=True)``; the function runs as
+        plain Python.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
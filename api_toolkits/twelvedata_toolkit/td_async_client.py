@@ -0,0 +1,240 @@
+"""Async TwelveData API client implementation."""
+from typing import Dict, Any, Optional, List, Mapping, Tuple
+import aiohttp
+from ..async_base_client import AsyncBaseAPIClient
+from ..cache import ResponseCache, ttl_lru_cache
+from ..config import APIConfig
+from .td_client import (
+    TwelveDataClient, _by_symbol, _cached_indicators, _check_error, _chunked, _indicator_batch,
+    _indicator_requests, _store_indicators, _unpack_batch
+)
+
+class AsyncTwelveDataClient(AsyncBaseAPIClient):
+    """Asyncio client for the TwelveData REST API.
+
+    Calls the REST endpoints directly so quotes, prices and time series for
+    many symbols can be fetched concurrently over one pooled session, e.g.::
+
+        async with AsyncTwelveDataClient() as client:
+            quotes = await client.get_quotes(['AAPL', 'MSFT', 'GOOGL'])
+    """
+
+    BATCH_SIZE = TwelveDataClient.BATCH_SIZE
+    DEFAULT_CACHE_TTLS = TwelveDataClient.DEFAULT_CACHE_TTLS
+    DAILY_INTERVALS = TwelveDataClient.DAILY_INTERVALS
+    DAILY_CACHE_TTL = TwelveDataClient.DAILY_CACHE_TTL
+    _cache_ttl = TwelveDataClient._cache_ttl
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, int]] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        """Initialize the async TwelveData client.
+
+        Args:
+            api_key: Optional API key (will use environment variable if not provided)
+            max_concurrency: Maximum number of requests in flight
+            cache: Optional response cache (caching is disabled if not provided)
+            cache_ttls: Optional TTL overrides in seconds, keyed by REST endpoint
+            session: Optional session shared with other clients (not closed by close())
+        """
+        api_key = api_key or APIConfig.TWELVEDATA_API_KEY
+        if not api_key:
+            raise ValueError("TwelveData API key is required")
+
+        super().__init__(
+            api_key=api_key,
+            base_url=APIConfig.TWELVEDATA_BASE_URL,
+            calls_per_minute=APIConfig.TWELVEDATA_RATE_LIMIT,
+            max_concurrency=max_concurrency,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            session=session
+        )
+
+    def _session_headers(self) -> Dict[str, str]:
+        """Authenticate with the Authorization header so the key stays out of URLs."""
+        return {'Authorization': f"apikey {self.api_key}"}
+
+    async def _send_request(self, url: str, *args: Any, **kwargs: Any) -> Tuple[Any, Mapping[str, str]]:
+        """Send a request and raise on TwelveData error payloads before they are cached."""
+        data, headers = await super()._send_request(url, *args, **kwargs)
+        return _check_error(data), headers
+
+    async def _query(self, endpoint: str, **params: Any) -> Any:
+        """Call a TwelveData REST endpoint.
+
+        Args:
+            endpoint: REST endpoint (e.g. 'quote')
+            **params: Query parameters
+
+        Returns:
+            Decoded response body
+        """
+        return await self._make_request(endpoint, params=params)
+
+    async def get_time_series(
+        self,
+        symbol: str,
+        interval: str = '1day',
+        outputsize: int = 30,
+        timezone: str = "UTC",
+        **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """Get time series values for a symbol.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            interval: Time interval ('1min', '5min', '1h', '1day', '1week', '1month')
+            outputsize: Number of data points (1-5000)
+            timezone: Timezone for timestamps
+            **kwargs: Additional query parameters
+
+        Returns:
+            Time series values, most recent first
+        """
+        data = await self._query(
+            'time_series',
+            symbol=symbol,
+            interval=interval,
+            outputsize=outputsize,
+            timezone=timezone,
+            **kwargs
+        )
+        return data['values']
+
+    @ttl_lru_cache(0)
+    async def get_technical_indicator(
+        self,
+        symbol: str,
+        interval: str,
+        indicator: str,
+        series_type: str = "close",
+        **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """Get technical indicator values.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            interval: Time interval ('1min', '5min', '1h', '1day', etc.)
+            indicator: Indicator name ('sma', 'ema', 'rsi', etc.), used as the REST endpoint
+            series_type: Type of series to use ('close', 'open', 'high', 'low')
+            **kwargs: Additional parameters required by the indicator
+
+        Returns:
+            Indicator values, most recent first
+        """
+        data = await self._query(
+            indicator.lower(),
+            symbol=symbol,
+            interval=interval,
+            series_type=series_type,
+            **kwargs
+        )
+        return data['values']
+
+    async def get_technical_indicators_batch(
+        self,
+        symbol: str,
+        interval: str,
+        specs: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get several technical indicators for a symbol in one request.
+
+        Indicators already in the response cache (shared with
+        get_technical_indicator) are not requested again; only the rest are
+        sent. TwelveData charges one credit per batched indicator, so the
+        request takes one token from the rate limiter per indicator sent.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            interval: Time interval ('1min', '5min', '1h', '1day', etc.)
+            specs: One dict per indicator with its name under 'indicator' and
+                any indicator parameters, e.g. ``{'indicator': 'rsi', 'time_period': 14}``
+
+        Returns:
+            Dictionary mapping each indicator name to its values
+
+        Raises:
+            ValueError: If specs is empty or names an indicator twice
+            TwelveDataError: If any of the batched requests failed
+        """
+        requests = _indicator_requests(symbol, interval, specs)
+        responses, missing = _cached_indicators(self, requests)
+        if missing:
+            # The request itself takes one token; take one more per extra indicator
+            await self._bucket.acquire_async(len(missing) - 1)
+            data = await self._make_request('batch', method='POST', body=_indicator_batch(missing))
+            fetched = _unpack_batch(data)
+            _store_indicators(self, missing, fetched)
+            responses.update(fetched)
+        return {name: responses[name]['values'] for name in requests}
+
+    async def get_quote(self, symbol: str) -> Dict[str, Any]:
+        """Get real-time quote for a symbol.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+
+        Returns:
+            Real-time quote data
+        """
+        return await self._query('quote', symbol=symbol)
+
+    async def get_price(self, symbol: str) -> Dict[str, Any]:
+        """Get latest price for a symbol.
+
+        Each call costs one request from the API quota. To follow a price in
+        real time, use TwelveDataClient.get_live_price or start_websocket
+        instead of polling this method in a loop.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+
+        Returns:
+            Latest price data
+        """
+        return await self._query('price', symbol=symbol)
+
+    async def _get_batch(self, endpoint: str, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch a per-symbol endpoint in comma-separated batches, concurrently.
+
+        Args:
+            endpoint: REST endpoint accepting comma-separated symbols ('quote' or 'price')
+            symbols: Stock symbols
+
+        Returns:
+            Dictionary mapping each symbol to its response object
+        """
+        chunks = list(_chunked(symbols, self.BATCH_SIZE))
+        responses = await self.gather(self._query(endpoint, symbol=','.join(chunk)) for chunk in chunks)
+        results = {}
+        for chunk, data in zip(chunks, responses):
+            results.update(_by_symbol(chunk, data))
+        return results
+
+    async def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get real-time quotes for several symbols in batched requests.
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            Dictionary mapping each symbol to its quote
+        """
+        return await self._get_batch('quote', symbols)
+
+    async def get_prices(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get latest prices for several symbols in batched requests.
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            Dictionary mapping each symbol to its price data
+        """
+        return await self._get_batch('price', symbols)
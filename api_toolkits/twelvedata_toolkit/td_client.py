@@ -1,29 +1,294 @@
-"""TwelveData API client implementation using official Python client."""
-from typing import Dict, Any, Optional, List, Union, Callable
+"""TwelveData API client implementation."""
+from typing import Dict, Any, Optional, List, Set, Union, Callable, Iterator, Mapping, Tuple, TYPE_CHECKING
+import logging
+from urllib.parse import urlencode
 from twelvedata import TDClient
+from twelvedata.exceptions import TwelveDataError
 import websockets
+from websockets.exceptions import ConnectionClosed, WebSocketException
 import asyncio
-import json
+from ..base_client import BaseAPIClient, get_shared_client
+from ..cache import ResponseCache, make_cache_key
 from ..config import APIConfig
+from ..json_utils import dumps, loads
 
-class TwelveDataClient:
-    """Client for interacting with the TwelveData API using official client."""
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+def _check_error(data: Any) -> Any:
+    """Raise if a decoded TwelveData response reports an error.
+    
+    TwelveData answers most failures with HTTP 200 and a body of the form
+    ``{"code": 400, "message": "...", "status": "error"}``.
+    
+    Args:
+        data: Decoded response body
+        
+    Returns:
+        The response body unchanged
+        
+    Raises:
+        TwelveDataError: If the body has status 'error'
+    """
+    if isinstance(data, dict) and data.get('status') == 'error':
+        raise TwelveDataError(data.get('message', 'Unknown TwelveData error'))
+    return data
+
+def _to_frame(rows: List[Dict[str, Any]], categories: Tuple[str, ...]) -> 'pd.DataFrame':
+    """Build a DataFrame from reference rows, storing repetitive columns as categoricals.
+    
+    Args:
+        rows: Rows as returned by the reference endpoints
+        categories: Columns with few distinct values (exchange, currency, ...)
+        
+    Returns:
+        DataFrame with the given columns converted to the category dtype
+    """
+    import pandas as pd
+    
+    df = pd.DataFrame.from_records(rows)
+    columns = [c for c in categories if c in df.columns]
+    if columns:
+        df = df.astype({c: 'category' for c in columns})
+    return df
+
+def _chunked(symbols: List[str], size: int) -> Iterator[List[str]]:
+    """Split symbols into lists of at most ``size`` items."""
+    for i in range(0, len(symbols), size):
+        yield symbols[i:i + size]
+
+def _by_symbol(chunk: List[str], data: Dict[str, Any]) -> Dict[str, Any]:
+    """Key a batch response by symbol.
+    
+    TwelveData returns ``{symbol: {...}}`` when several comma-separated symbols
+    are requested, but the bare object when only one is.
+    """
+    return {chunk[0]: data} if len(chunk) == 1 else data
+
+# Indicator name -> (REST endpoint, query parameters) of its request
+IndicatorRequests = Dict[str, Tuple[str, Dict[str, Any]]]
+
+def _indicator_requests(symbol: str, interval: str, specs: List[Dict[str, Any]]) -> IndicatorRequests:
+    """Describe the single-indicator requests making up a batch.
+    
+    The parameters match those get_technical_indicator sends, so batched and
+    single calls share response cache entries.
+    
+    Args:
+        symbol: Stock symbol (e.g., 'AAPL')
+        interval: Time interval ('1min', '5min', '1h', '1day', etc.)
+        specs: Indicator specs such as ``{'indicator': 'rsi', 'time_period': 14}``
+        
+    Returns:
+        Endpoint and query parameters keyed by indicator name
+        
+    Raises:
+        ValueError: If no specs are given or an indicator appears twice, since
+            batched results are keyed by indicator name
+    """
+    if not specs:
+        raise ValueError("At least one indicator spec is required")
+    requests = {}
+    for spec in specs:
+        params = dict(spec)
+        indicator = params.pop('indicator').lower()
+        if indicator in requests:
+            raise ValueError(f"Indicator {indicator!r} appears more than once in the batch")
+        requests[indicator] = (indicator, {'symbol': symbol, 'interval': interval, 'series_type': 'close', **params})
+    return requests
+
+def _indicator_batch(requests: IndicatorRequests) -> Dict[str, Dict[str, str]]:
+    """Build a /batch request body, keying each request by its indicator name."""
+    return {
+        name: {'url': f"/{endpoint}?{urlencode(params)}"}
+        for name, (endpoint, params) in requests.items()
+    }
+
+def _unpack_batch(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Return the response of each request in a /batch response.
+    
+    Raises:
+        TwelveDataError: If any of the batched requests failed
+    """
+    return {
+        key: _check_error(item['response'])
+        for key, item in data['data'].items()
+    }
+
+def _cached_indicators(client: Any, requests: IndicatorRequests) -> Tuple[Dict[str, Any], IndicatorRequests]:
+    """Split indicator requests into fresh cached responses and requests still to send.
+    
+    Args:
+        client: Sync or async TwelveData client
+        requests: Requests as built by _indicator_requests
+        
+    Returns:
+        Cached responses keyed by indicator name, and the requests not in the cache
+    """
+    cached, missing = {}, {}
+    for name, (endpoint, params) in requests.items():
+        data = None
+        if client.cache is not None and client._cache_ttl(endpoint, params) is not None:
+            data = client.cache.get(make_cache_key(f"{client.base_url}/{endpoint}", params))
+        if data is None:
+            missing[name] = (endpoint, params)
+        else:
+            logger.debug("Cache hit: %s %s", endpoint, params)
+            cached[name] = data
+    return cached, missing
+
+def _store_indicators(client: Any, requests: IndicatorRequests, responses: Dict[str, Any]) -> None:
+    """Cache the batched responses under the keys of their single-indicator requests."""
+    if client.cache is None:
+        return
+    for name, (endpoint, params) in requests.items():
+        ttl = client._cache_ttl(endpoint, params)
+        if ttl is not None:
+            client.cache.set(make_cache_key(f"{client.base_url}/{endpoint}", params), responses[name], ttl)
+
+def _iter_data_items(stream: Any) -> Iterator[Dict[str, Any]]:
+    """Incrementally parse the objects of the top-level ``data`` list of a response.
+    
+    Args:
+        stream: Binary file-like object with the response body
+        
+    Yields:
+        Each object in ``data`` as soon as it has been parsed
+        
+    Raises:
+        TwelveDataError: If the body reports status 'error'
+    """
+    builder = None
+    error = message = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if prefix == 'data.item' and event == 'start_map':
+            builder = ijson.ObjectBuilder()
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == 'data.item' and event == 'end_map':
+                yield builder.value
+                builder = None
+        elif prefix == 'status':
+            error = value == 'error'
+        elif prefix == 'message':
+            message = value
+    if error:
+        raise TwelveDataError(message or 'Unknown TwelveData error')
+
+class TwelveDataClient(BaseAPIClient):
+    """Client for interacting with the TwelveData REST and WebSocket APIs."""
     
     WEBSOCKET_URL = "wss://ws.twelvedata.com/v1/quotes/price"
     
-    def __init__(self, api_key: Optional[str] = None):
+    # permessage-deflate for the price stream ('deflate' enables it) and the
+    # maximum incoming frame size (None removes the limit). Price events are
+    # small, so compressing them costs more CPU than it saves bandwidth.
+    WEBSOCKET_COMPRESSION: Optional[str] = None
+    WEBSOCKET_MAX_SIZE: Optional[int] = None
+    
+    # Messages buffered between the socket reader and on_message; the oldest
+    # are dropped when a slow handler lets the buffer fill up
+    WEBSOCKET_QUEUE_SIZE = 10000
+    
+    # Keepalive pings and reconnect backoff, in seconds
+    WEBSOCKET_PING_INTERVAL = 15
+    WEBSOCKET_PING_TIMEOUT = 20
+    RECONNECT_MAX_DELAY = 30
+    
+    # Maximum symbols per comma-separated batch request
+    BATCH_SIZE = 120
+    
+    # Cache TTLs in seconds, matched to how often each endpoint changes
+    DEFAULT_CACHE_TTLS = {
+        'price': 1,
+        'quote': 5,
+        'stocks': 86400,
+        'forex_pairs': 86400,
+        'cryptocurrencies': 86400,
+        'earliest_timestamp': 2592000
+    }
+    
+    # Time series and indicators at these intervals get at most one new bar a
+    # day, so they are cached for DAILY_CACHE_TTL seconds
+    DAILY_INTERVALS = frozenset({'1day', '1week', '1month'})
+    DAILY_CACHE_TTL = 86400
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, int]] = None
+    ):
         """Initialize the TwelveData client.
         
         Args:
             api_key: Optional API key (will use environment variable if not provided)
+            cache: Optional response cache (caching is disabled if not provided)
+            cache_ttls: Optional TTL overrides in seconds, keyed by REST endpoint
         """
-        self.api_key = api_key or APIConfig.TWELVEDATA_API_KEY
-        if not self.api_key:
+        api_key = api_key or APIConfig.TWELVEDATA_API_KEY
+        if not api_key:
             raise ValueError("TwelveData API key is required")
             
-        self.client = TDClient(apikey=self.api_key)
+        super().__init__(
+            api_key=api_key,
+            base_url=APIConfig.TWELVEDATA_BASE_URL,
+            calls_per_minute=APIConfig.TWELVEDATA_RATE_LIMIT,
+            cache=cache,
+            cache_ttls=cache_ttls
+        )
+        self.session.headers['Authorization'] = f"apikey {self.api_key}"
+        self._client = None
+        self._frames: Dict[Tuple[str, Tuple[str, ...]], str] = {}
         self.ws = None
         self._running = False
+        self._subscribed: Set[str] = set()
+    
+    @property
+    def client(self) -> TDClient:
+        """Official twelvedata TDClient, created on first access.
+        
+        Kept for backward compatibility; none of this class's methods use it.
+        """
+        if self._client is None:
+            self._client = TDClient(apikey=self.api_key)
+        return self._client
+    
+    def _cache_ttl(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Return the endpoint's TTL, or DAILY_CACHE_TTL for daily or slower bars."""
+        ttl = self.cache_ttls.get(endpoint)
+        if ttl is None and params and params.get('interval') in self.DAILY_INTERVALS:
+            ttl = self.DAILY_CACHE_TTL
+        return ttl
+    
+    def _send_request(self, endpoint: str, *args: Any, **kwargs: Any) -> Tuple[Any, Mapping[str, str]]:
+        """Send a request and raise on TwelveData error payloads before they are cached."""
+        data, headers = super()._send_request(endpoint, *args, **kwargs)
+        return _check_error(data), headers
+    
+    def _get_batch(self, endpoint: str, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch a per-symbol endpoint for many symbols in as few requests as possible.
+        
+        Args:
+            endpoint: REST endpoint accepting comma-separated symbols ('quote' or 'price')
+            symbols: Stock symbols
+            
+        Returns:
+            Dictionary mapping each symbol to its response object
+        """
+        results = {}
+        for chunk in _chunked(symbols, self.BATCH_SIZE):
+            data = self._make_request(endpoint, params={'symbol': ','.join(chunk)})
+            results.update(_by_symbol(chunk, data))
+        return results
     
     def get_time_series(
         self,
@@ -32,27 +297,116 @@ class TwelveDataClient:
         outputsize: int = 30,
         timezone: str = "UTC",
         **kwargs
-    ) -> Dict[str, Any]:
+    ) -> List[Dict[str, Any]]:
         """Get time series data for a symbol.
         
+        Daily and slower series are cached when the client has a cache.
+        
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            interval: Time interval ('1min', '5min', '1h', '1day', '1week', '1month')
+            outputsize: Number of data points (1-5000)
+            timezone: Timezone for timestamps
+            **kwargs: Additional query parameters
+            
+        Returns:
+            Time series values, most recent first
+        """
+        return self._make_request('time_series', params={
+            'symbol': symbol,
+            'interval': interval,
+            'outputsize': outputsize,
+            'timezone': timezone,
+            **kwargs
+        })['values']
+    
+    def get_time_series_arrays(
+        self,
+        symbol: str,
+        interval: str = '1day',
+        outputsize: int = 30,
+        timezone: str = "UTC",
+        **kwargs
+    ) -> Dict[str, 'np.ndarray']:
+        """Get time series data as NumPy columns in chronological order.
+        
+        The string fields of the JSON response are parsed once into typed
+        arrays, ready for the sma/ema/rsi kernels in ``_indicators`` (which are
+        JIT-compiled when numba is installed).
+        
         Args:
             symbol: Stock symbol (e.g., 'AAPL')
-            interval: Time interval ('1min', '5min', '1hour', '1day', '1week', '1month')
+            interval: Time interval ('1min', '5min', '1h', '1day', '1week', '1month')
             outputsize: Number of data points (1-5000)
             timezone: Timezone for timestamps
             **kwargs: Additional parameters to pass to the time_series method
             
         Returns:
-            Time series data in JSON format
+            Dictionary with a 'datetime' datetime64 array and float64 arrays for
+            'open', 'high', 'low', 'close' (and 'volume' when reported)
         """
-        ts = self.client.time_series(
-            symbol=symbol,
+        import numpy as np
+        
+        values = list(reversed(self.get_time_series(
+            symbol,
             interval=interval,
             outputsize=outputsize,
             timezone=timezone,
             **kwargs
-        )
-        return ts.as_json()
+        )))
+        count = len(values)
+        fields = ['open', 'high', 'low', 'close']
+        if values and 'volume' in values[0]:
+            fields.append('volume')
+        
+        arrays = {'datetime': np.array([v['datetime'] for v in values], dtype='datetime64[s]')}
+        for field in fields:
+            arrays[field] = np.fromiter((float(v[field]) for v in values), dtype=np.float64, count=count)
+        return arrays
+    
+    def get_time_series_df(
+        self,
+        symbol: str,
+        interval: str = '1day',
+        outputsize: int = 30,
+        timezone: str = "UTC",
+        **kwargs
+    ) -> 'pd.DataFrame':
+        """Get time series data as a typed DataFrame.
+        
+        Calls the REST endpoint directly and converts the string fields of the
+        response column-wise: prices become float64, volume a numeric column
+        and the datetime index datetime64, sorted oldest first.
+        
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            interval: Time interval ('1min', '5min', '1h', '1day', '1week', '1month')
+            outputsize: Number of data points (1-5000)
+            timezone: Timezone for timestamps
+            **kwargs: Additional query parameters
+            
+        Returns:
+            DataFrame indexed by datetime with open/high/low/close (and volume) columns
+        """
+        import pandas as pd
+        
+        data = self._make_request('time_series', params={
+            'symbol': symbol,
+            'interval': interval,
+            'outputsize': outputsize,
+            'timezone': timezone,
+            **kwargs
+        })
+        df = pd.DataFrame.from_records(data.get('values', []))
+        if df.empty:
+            return df
+        
+        prices = [c for c in ('open', 'high', 'low', 'close') if c in df.columns]
+        df[prices] = df[prices].astype('float64')
+        if 'volume' in df.columns:
+            df['volume'] = pd.to_numeric(df['volume'])
+        df['datetime'] = pd.to_datetime(df['datetime'])
+        return df.set_index('datetime').sort_index()
     
     def get_quote(self, symbol: str) -> Dict[str, Any]:
         """Get real-time quote for a symbol.
@@ -63,18 +417,47 @@ class TwelveDataClient:
         Returns:
             Real-time quote data
         """
-        return self.client.quote(symbol=symbol).as_json()
+        return self._make_request('quote', params={'symbol': symbol})
     
     def get_price(self, symbol: str) -> Dict[str, Any]:
         """Get latest price for a symbol.
         
+        Each call costs one request from the API quota. To follow a price in
+        real time, use get_live_price or start_websocket instead of polling
+        this method in a loop.
+        
         Args:
             symbol: Stock symbol (e.g., 'AAPL')
             
         Returns:
             Latest price data
         """
-        return self.client.price(symbol=symbol).as_json()
+        return self._make_request('price', params={'symbol': symbol})
+    
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get real-time quotes for several symbols.
+        
+        Symbols are sent comma-separated, up to BATCH_SIZE per request, so a
+        watchlist costs one request per batch instead of one per symbol.
+        
+        Args:
+            symbols: Stock symbols (e.g., ['AAPL', 'MSFT'])
+            
+        Returns:
+            Dictionary mapping each symbol to its quote
+        """
+        return self._get_batch('quote', symbols)
+    
+    def get_prices(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get latest prices for several symbols, batched like get_quotes.
+        
+        Args:
+            symbols: Stock symbols (e.g., ['AAPL', 'MSFT'])
+            
+        Returns:
+            Dictionary mapping each symbol to its price data
+        """
+        return self._get_batch('price', symbols)
     
     def get_stocks_list(
         self,
@@ -94,12 +477,80 @@ class TwelveDataClient:
         Returns:
             List of stocks matching the criteria
         """
-        return self.client.stocks(
-            exchange=exchange,
-            type=type,
-            symbol=symbol,
-            show_plan=show_plan
-        ).as_json()
+        return self._make_request('stocks', params={
+            'exchange': exchange,
+            'type': type,
+            'symbol': symbol,
+            'show_plan': str(show_plan).lower()
+        })['data']
+    
+    def iter_stocks_list(
+        self,
+        exchange: Optional[str] = None,
+        type: Optional[str] = None,
+        symbol: Optional[str] = None,
+        show_plan: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over available stocks while the listing downloads.
+        
+        With ijson installed the response is parsed incrementally, so callers
+        that stop early (e.g. with itertools.islice) never decode the rest of
+        the listing. With a cache, a fresh entry is served without a request
+        and a fully consumed stream is cached (shared with get_stocks_list),
+        which keeps every row in memory until the end. Without ijson this
+        falls back to get_stocks_list.
+        
+        Args:
+            exchange: Filter by exchange (e.g., 'NASDAQ')
+            type: Filter by type ('Common Stock', 'ETF', etc.)
+            symbol: Filter by symbol pattern
+            show_plan: Show API plan details
+            
+        Yields:
+            Stocks matching the criteria
+        """
+        if ijson is None:
+            yield from self.get_stocks_list(exchange=exchange, type=type, symbol=symbol, show_plan=show_plan)
+            return
+        
+        params = {'exchange': exchange, 'type': type, 'symbol': symbol, 'show_plan': str(show_plan).lower()}
+        
+        def stream() -> Iterator[Dict[str, Any]]:
+            with self._request(
+                'GET',
+                f"{self.base_url}/stocks",
+                params={k: v for k, v in params.items() if v is not None},
+                stream=True
+            ) as response:
+                response.raw.decode_content = True
+                yield from _iter_data_items(response.raw)
+        
+        yield from self._iter_cached('stocks', params, stream, field='data')
+    
+    def get_stocks_df(
+        self,
+        exchange: Optional[str] = None,
+        type: Optional[str] = None,
+        symbol: Optional[str] = None
+    ) -> 'pd.DataFrame':
+        """Get list of available stocks as a DataFrame.
+        
+        Exchange, country, type and currency are stored as categoricals, so
+        filtering the full universe (tens of thousands of rows) is a vectorized
+        comparison on small integer codes.
+        
+        Args:
+            exchange: Filter by exchange (e.g., 'NASDAQ')
+            type: Filter by type ('Common Stock', 'ETF', etc.)
+            symbol: Filter by symbol pattern
+            
+        Returns:
+            DataFrame with one row per stock
+        """
+        return _to_frame(
+            self.get_stocks_list(exchange=exchange, type=type, symbol=symbol),
+            ('exchange', 'mic_code', 'country', 'type', 'currency')
+        )
     
     def get_technical_indicator(
         self,
@@ -108,77 +559,163 @@ class TwelveDataClient:
         indicator: str,
         series_type: str = "close",
         **kwargs
-    ) -> Dict[str, Any]:
+    ) -> List[Dict[str, Any]]:
         """Get technical indicator values.
         
+        Daily and slower indicators are cached when the client has a cache.
+        
         Args:
             symbol: Stock symbol (e.g., 'AAPL')
-            interval: Time interval ('1min', '5min', '1hour', '1day', etc.)
-            indicator: Indicator name ('sma', 'ema', 'rsi', etc.)
+            interval: Time interval ('1min', '5min', '1h', '1day', etc.)
+            indicator: Indicator name ('sma', 'ema', 'rsi', etc.), used as the REST endpoint
             series_type: Type of series to use ('close', 'open', 'high', 'low')
             **kwargs: Additional parameters required by the indicator
             
         Returns:
-            Technical indicator data
+            Indicator values, most recent first
         """
-        indicator_method = getattr(self.client, indicator.lower())
-        return indicator_method(
-            symbol=symbol,
-            interval=interval,
-            series_type=series_type,
+        return self._make_request(indicator.lower(), params={
+            'symbol': symbol,
+            'interval': interval,
+            'series_type': series_type,
             **kwargs
-        ).as_json()
+        })['values']
+    
+    def get_technical_indicators_batch(
+        self,
+        symbol: str,
+        interval: str,
+        specs: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get several technical indicators for a symbol in one request.
+        
+        Indicators already in the response cache (shared with
+        get_technical_indicator) are not requested again; only the rest are
+        sent. TwelveData charges one credit per batched indicator, so the
+        request takes one token from the rate limiter per indicator sent.
+        
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            interval: Time interval ('1min', '5min', '1h', '1day', etc.)
+            specs: One dict per indicator with its name under 'indicator' and
+                any indicator parameters, e.g. ``{'indicator': 'rsi', 'time_period': 14}``
+            
+        Returns:
+            Dictionary mapping each indicator name to its values
+            
+        Raises:
+            ValueError: If specs is empty or names an indicator twice
+            TwelveDataError: If any of the batched requests failed
+        """
+        requests = _indicator_requests(symbol, interval, specs)
+        responses, missing = _cached_indicators(self, requests)
+        if missing:
+            # The request itself takes one token; take one more per extra indicator
+            self._bucket.acquire(len(missing) - 1)
+            fetched = _unpack_batch(self._make_request('batch', method='POST', body=_indicator_batch(missing)))
+            _store_indicators(self, missing, fetched)
+            responses.update(fetched)
+        return {name: responses[name]['values'] for name in requests}
+    
+    def _open_websocket(self) -> Any:
+        """Return a pending connection to the price stream with the client's settings.
+        
+        The result can be awaited for a long-lived connection or used with
+        ``async with`` for one that closes itself.
+        """
+        return websockets.connect(
+            f"{self.WEBSOCKET_URL}?apikey={self.api_key}",
+            compression=self.WEBSOCKET_COMPRESSION,
+            max_size=self.WEBSOCKET_MAX_SIZE,
+            ping_interval=self.WEBSOCKET_PING_INTERVAL,
+            ping_timeout=self.WEBSOCKET_PING_TIMEOUT
+        )
     
     async def connect_websocket(self) -> None:
         """Connect to TwelveData WebSocket server."""
         if self.ws is not None:
             return
             
-        url = f"{self.WEBSOCKET_URL}?apikey={self.api_key}"
-        self.ws = await websockets.connect(url)
+        self.ws = await self._open_websocket()
         self._running = True
     
+    async def _reconnect(self) -> None:
+        """Reopen a dropped connection and restore its subscriptions.
+        
+        Retries with exponential backoff (1, 2, 4, ... seconds, capped at
+        RECONNECT_MAX_DELAY) until connected or close_websocket() is called.
+        """
+        delay = 1
+        while self._running:
+            self.ws = None
+            await asyncio.sleep(delay)
+            if not self._running:
+                return
+            try:
+                await self.connect_websocket()
+                if self._subscribed:
+                    await self.ws.send(self._frame("subscribe", sorted(self._subscribed)))
+                logger.info("Reconnected to TwelveData WebSocket")
+                return
+            except (OSError, WebSocketException) as e:
+                logger.warning("WebSocket reconnect failed, retrying in %ss: %s", delay, e)
+                delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+    
+    def _frame(self, action: str, symbols: Union[str, List[str]]) -> str:
+        """Return the encoded subscribe/unsubscribe message, building it once per symbol set.
+        
+        Args:
+            action: 'subscribe' or 'unsubscribe'
+            symbols: Single symbol or list of symbols
+            
+        Returns:
+            JSON text frame
+        """
+        key = (action, (symbols,) if isinstance(symbols, str) else tuple(symbols))
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = dumps({
+                "action": action,
+                "params": {
+                    "symbols": ",".join(key[1])
+                }
+            })
+        return frame
+    
     async def subscribe(self, symbols: Union[str, List[str]]) -> None:
         """Subscribe to real-time price updates for symbols.
         
+        Only symbols that are not already subscribed are sent, so callers can
+        pass their full watch list to an open connection at any time.
+        
         Args:
             symbols: Single symbol or list of symbols to subscribe to
         """
-        if isinstance(symbols, str):
-            symbols = [symbols]
-            
         if not self.ws:
             await self.connect_websocket()
-            
-        message = {
-            "action": "subscribe",
-            "params": {
-                "symbols": ",".join(symbols)
-            }
-        }
         
-        await self.ws.send(json.dumps(message))
+        new = [s for s in ([symbols] if isinstance(symbols, str) else symbols) if s not in self._subscribed]
+        if not new:
+            return
+        await self.ws.send(self._frame("subscribe", new))
+        self._subscribed.update(new)
     
     async def unsubscribe(self, symbols: Union[str, List[str]]) -> None:
         """Unsubscribe from real-time price updates for symbols.
         
+        Symbols that are not subscribed are ignored.
+        
         Args:
             symbols: Single symbol or list of symbols to unsubscribe from
         """
-        if isinstance(symbols, str):
-            symbols = [symbols]
-            
         if not self.ws:
             return
-            
-        message = {
-            "action": "unsubscribe",
-            "params": {
-                "symbols": ",".join(symbols)
-            }
-        }
         
-        await self.ws.send(json.dumps(message))
+        current = [s for s in ([symbols] if isinstance(symbols, str) else symbols) if s in self._subscribed]
+        if not current:
+            return
+        await self.ws.send(self._frame("unsubscribe", current))
+        self._subscribed.difference_update(current)
     
     async def start_websocket(
         self,
@@ -188,32 +725,99 @@ class TwelveDataClient:
     ) -> None:
         """Start WebSocket connection and handle incoming messages.
         
+        The socket is read by this coroutine while a separate task runs
+        on_message, so a slow handler never stalls recv(). Messages are
+        buffered in a queue of WEBSOCKET_QUEUE_SIZE, dropping the oldest when full.
+        If the connection drops, it is reopened with exponential backoff and
+        the current subscriptions are sent again.
+        
         Args:
             symbols: Symbols to subscribe to
             on_message: Callback function for handling incoming messages
             on_error: Optional callback function for handling errors
         """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.WEBSOCKET_QUEUE_SIZE)
+        consumer = asyncio.create_task(self._consume(queue, on_message, on_error))
         try:
             await self.connect_websocket()
             await self.subscribe(symbols)
             
             while self._running:
                 try:
-                    message = await self.ws.recv()
-                    data = json.loads(message)
-                    await on_message(data)
+                    data = loads(await self.ws.recv())
+                except ConnectionClosed as e:
+                    await self._report_error(e, on_error)
+                    await self._reconnect()
+                    continue
                 except Exception as e:
-                    if on_error:
-                        await on_error(e)
-                    else:
-                        print(f"WebSocket error: {str(e)}")
+                    await self._report_error(e, on_error)
+                    continue
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(data)
                         
         finally:
+            consumer.cancel()
+            await asyncio.gather(consumer, return_exceptions=True)
             await self.close_websocket()
     
+    async def _consume(
+        self,
+        queue: asyncio.Queue,
+        on_message: Callable[[Dict[str, Any]], None],
+        on_error: Optional[Callable[[Exception], None]]
+    ) -> None:
+        """Pass queued messages to on_message until cancelled."""
+        while True:
+            data = await queue.get()
+            try:
+                await on_message(data)
+            except Exception as e:
+                await self._report_error(e, on_error)
+    
+    @staticmethod
+    async def _report_error(error: Exception, on_error: Optional[Callable[[Exception], None]]) -> None:
+        if on_error:
+            await on_error(error)
+        else:
+            print(f"WebSocket error: {str(error)}")
+    
+    async def get_live_price(self, symbol: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Wait for the next streamed price event for a symbol.
+        
+        Uses its own short-lived connection rather than the client's ``ws``,
+        so it is safe to call while start_websocket is streaming and leaves
+        that stream and its subscriptions untouched.
+        
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            timeout: Optional number of seconds to wait
+            
+        Returns:
+            Price event data
+            
+        Raises:
+            asyncio.TimeoutError: If no price arrives within the timeout
+            ConnectionError: If the server closes the stream before a price arrives
+        """
+        async def next_price() -> Dict[str, Any]:
+            async with self._open_websocket() as ws:
+                await ws.send(self._frame("subscribe", symbol))
+                async for message in ws:
+                    data = loads(message)
+                    if data.get('event') == 'price' and data.get('symbol') == symbol:
+                        return data
+            raise ConnectionError(f"WebSocket stream for {symbol} ended before a price arrived")
+        
+        try:
+            return await asyncio.wait_for(next_price(), timeout)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"No price for {symbol} within {timeout} seconds") from None
+    
     async def close_websocket(self) -> None:
         """Close the WebSocket connection."""
         self._running = False
+        self._subscribed.clear()
         if self.ws:
             await self.ws.close()
             self.ws = None
@@ -224,7 +828,7 @@ class TwelveDataClient:
         Returns:
             List of available cryptocurrencies
         """
-        return self.client.cryptocurrencies().as_json()
+        return self._make_request('cryptocurrencies')['data']
     
     def get_forex_pairs(self) -> List[Dict[str, Any]]:
         """Get list of available forex pairs.
@@ -232,7 +836,23 @@ class TwelveDataClient:
         Returns:
             List of available forex pairs
         """
-        return self.client.forex_pairs().as_json()
+        return self._make_request('forex_pairs')['data']
+    
+    def get_cryptocurrency_df(self) -> 'pd.DataFrame':
+        """Get list of available cryptocurrencies as a DataFrame with categorical currencies.
+        
+        Returns:
+            DataFrame with one row per cryptocurrency pair
+        """
+        return _to_frame(self.get_cryptocurrency_list(), ('currency_base', 'currency_quote'))
+    
+    def get_forex_pairs_df(self) -> 'pd.DataFrame':
+        """Get list of available forex pairs as a DataFrame with categorical currencies.
+        
+        Returns:
+            DataFrame with one row per forex pair
+        """
+        return _to_frame(self.get_forex_pairs(), ('currency_group', 'currency_base', 'currency_quote'))
     
     def get_earliest_timestamp(
         self,
@@ -244,14 +864,29 @@ class TwelveDataClient:
         
         Args:
             symbol: Stock symbol (e.g., 'AAPL')
-            interval: Time interval ('1min', '5min', '1hour', '1day', etc.)
+            interval: Time interval ('1min', '5min', '1h', '1day', etc.)
             exchange: Specific exchange (optional)
             
         Returns:
             Earliest timestamp information
         """
-        return self.client.earliest_timestamp(
-            symbol=symbol,
-            interval=interval,
-            exchange=exchange
-        ).as_json() 
\ No newline at end of file
+        return self._make_request('earliest_timestamp', params={
+            'symbol': symbol,
+            'interval': interval,
+            'exchange': exchange
+        })
+
+
+def get_twelvedata(api_key: Optional[str] = None) -> TwelveDataClient:
+    """Return the shared TwelveDataClient for an API key.
+    
+    The pooled session and rate limiter are reused by every caller instead of
+    being rebuilt per construction.
+    
+    Args:
+        api_key: Optional API key (will use environment variable if not provided)
+        
+    Returns:
+        Shared client instance (closing it invalidates the shared instance)
+    """
+    return get_shared_client(TwelveDataClient, api_key)
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""Async prompt helper shared by the interactive test scripts."""
+import asyncio
+from typing import Any
+
+try:
+    from prompt_toolkit import PromptSession
+except ImportError:
+    PromptSession = None
+
+class Menu:
+    """Async prompt bound to the client a test script drives.
+
+    Input is read without blocking the event loop, using prompt_toolkit when
+    it is installed and a worker thread otherwise.
+    """
+
+    def __init__(self, client: Any, symbol_prompt: str = "Enter a stock symbol (e.g., AAPL): "):
+        """Initialize the menu.
+
+        Args:
+            client: Async API client used by the menu handlers
+            symbol_prompt: Prompt shown by ask_symbol
+        """
+        self.client = client
+        self.symbol_prompt = symbol_prompt
+        self._prompt = PromptSession() if PromptSession is not None else None
+
+    async def ask(self, message: str) -> str:
+        """Read a line of input."""
+        if self._prompt is not None:
+            return await self._prompt.prompt_async(message)
+        return await asyncio.to_thread(input, message)
+
+    async def ask_symbol(self) -> str:
+        """Read an upper-cased stock symbol."""
+        return (await self.ask(self.symbol_prompt)).upper()
+
+    async def close(self) -> None:
+        """Close the client."""
+        await self.client.close()
@@ -1,96 +1,102 @@
 """Test script for AlphaVantage API toolkit - Market data and company information."""
-from api_toolkits.alphavantage_toolkit import AlphaVantageClient
-import json
+import asyncio
+from typing import Awaitable, Callable, Dict
+from api_toolkits.alphavantage_toolkit import AsyncAlphaVantageClient
+from api_toolkits.json_utils import write_json, write_section
+from async_menu import Menu
 
 def format_output(data: dict, indent: int = 2) -> None:
-    """Helper function to pretty print JSON data."""
-    print(json.dumps(data, indent=indent))
+    """Helper function to pretty print JSON data, streaming lists row by row."""
+    write_json(data, indent=indent)
 
-def test_alphavantage():
+async def _daily_time_series(menu: Menu) -> None:
+    """Daily Time Series"""
+    symbol = await menu.ask_symbol()
+    size = (await menu.ask("Enter size (compact/full) [default: compact]: ")).lower() or 'compact'
+    data_type = (await menu.ask("Enter data type (json/csv) [default: json]: ")).lower() or 'json'
+
+    print(f"\nFetching daily time series for {symbol}...")
+    format_output(await menu.client.get_time_series_daily(symbol, size, data_type))
+
+async def _company_overview(menu: Menu) -> None:
+    """Company Overview"""
+    symbol = await menu.ask_symbol()
+
+    print(f"\nFetching company overview for {symbol}...")
+    format_output(await menu.client.get_company_overview(symbol))
+
+async def _earnings(menu: Menu) -> None:
+    """Earnings Data"""
+    symbol = await menu.ask_symbol()
+
+    print(f"\nFetching earnings data for {symbol}...")
+    earnings = await menu.client.get_earnings(symbol)
+
+    # Display annual and quarterly earnings separately
+    if 'annualEarnings' in earnings:
+        write_section("Annual Earnings:", earnings['annualEarnings'])
+    if 'quarterlyEarnings' in earnings:
+        write_section("Quarterly Earnings:", earnings['quarterlyEarnings'])
+
+async def _global_quote(menu: Menu) -> None:
+    """Global Quote"""
+    symbol = await menu.ask_symbol()
+
+    print(f"\nFetching current quote for {symbol}...")
+    format_output(await menu.client.get_global_quote(symbol))
+
+async def _symbol_search(menu: Menu) -> None:
+    """Symbol Search"""
+    keywords = await menu.ask("Enter search keywords: ")
+
+    print(f"\nSearching for symbols matching '{keywords}'...")
+    format_output(await menu.client.search_symbol(keywords))
+
+# Menu choice -> handler
+HANDLERS: Dict[str, Callable[[Menu], Awaitable[None]]] = {
+    '1': _daily_time_series,
+    '2': _company_overview,
+    '3': _earnings,
+    '4': _global_quote,
+    '5': _symbol_search
+}
+
+async def test_alphavantage():
     """Test various AlphaVantage API functionalities."""
-    
+
     # Initialize the AlphaVantage client
-    client = AlphaVantageClient()
-    
-    while True:
-        print("\nAlphaVantage API Test Menu:")
-        print("1. Get Daily Time Series")
-        print("2. Get Company Overview")
-        print("3. Get Earnings Data")
-        print("4. Get Global Quote")
-        print("5. Search Symbols")
-        print("6. Exit")
-        
-        choice = input("\nEnter your choice (1-6): ")
-        
-        if choice == "6":
-            print("Exiting...")
-            break
-            
-        try:
-            if choice == "1":
-                # Daily Time Series
-                symbol = input("Enter a stock symbol (e.g., AAPL): ").upper()
-                size = input("Enter size (compact/full) [default: compact]: ").lower() or 'compact'
-                data_type = input("Enter data type (json/csv) [default: json]: ").lower() or 'json'
-                
-                print(f"\nFetching daily time series for {symbol}...")
-                data = client.get_time_series_daily(
-                    symbol=symbol,
-                    outputsize=size,
-                    datatype=data_type
-                )
-                format_output(data)
-                
-            elif choice == "2":
-                # Company Overview
-                symbol = input("Enter a stock symbol (e.g., AAPL): ").upper()
-                
-                print(f"\nFetching company overview for {symbol}...")
-                overview = client.get_company_overview(symbol)
-                format_output(overview)
-                
-            elif choice == "3":
-                # Earnings Data
-                symbol = input("Enter a stock symbol (e.g., AAPL): ").upper()
-                
-                print(f"\nFetching earnings data for {symbol}...")
-                earnings = client.get_earnings(symbol)
-                
-                # Display annual and quarterly earnings separately
-                if 'annualEarnings' in earnings:
-                    print("\nAnnual Earnings:")
-                    format_output(earnings['annualEarnings'])
-                if 'quarterlyEarnings' in earnings:
-                    print("\nQuarterly Earnings:")
-                    format_output(earnings['quarterlyEarnings'])
-                
-            elif choice == "4":
-                # Global Quote
-                symbol = input("Enter a stock symbol (e.g., AAPL): ").upper()
-                
-                print(f"\nFetching current quote for {symbol}...")
-                quote = client.get_global_quote(symbol)
-                format_output(quote)
-                
-            elif choice == "5":
-                # Symbol Search
-                keywords = input("Enter search keywords: ")
-                
-                print(f"\nSearching for symbols matching '{keywords}'...")
-                results = client.search_symbol(keywords)
-                format_output(results)
-                
-            else:
+    menu = Menu(AsyncAlphaVantageClient())
+
+    try:
+        while True:
+            print("\nAlphaVantage API Test Menu:")
+            print("1. Get Daily Time Series")
+            print("2. Get Company Overview")
+            print("3. Get Earnings Data")
+            print("4. Get Global Quote")
+            print("5. Search Symbols")
+            print("6. Exit")
+
+            choice = await menu.ask("\nEnter your choice (1-6): ")
+
+            if choice == "6":
+                print("Exiting...")
+                break
+
+            handler = HANDLERS.get(choice)
+            if handler is None:
                 print("Invalid choice. Please try again.")
-                
-        except Exception as e:
-            print(f"Error: {str(e)}")
-            
-    # Close the client
-    client.close()
+                continue
+
+            try:
+                await handler(menu)
+            except Exception as e:
+                print(f"Error: {str(e)}")
+    finally:
+        # Close the client
+        await menu.close()
 
 if __name__ == "__main__":
     print("AlphaVantage API Toolkit Test")
     print("=" * 50)
-    test_alphavantage() 
\ No newline at end of file
+    asyncio.run(test_alphavantage())
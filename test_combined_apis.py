@@ -1,22 +1,67 @@
 """Test script demonstrating combined usage of all three API toolkits."""
-from api_toolkits.finnhub_toolkit import FinnhubClient
-from api_toolkits.twelvedata_toolkit import TwelveDataClient
-from api_toolkits.alphavantage_toolkit import AlphaVantageClient
-from datetime import datetime, timedelta
-import json
+import asyncio
+import sys
+from contextlib import aclosing
+from api_toolkits.finnhub_toolkit import AsyncFinnhubClient
+from api_toolkits.twelvedata_toolkit import AsyncTwelveDataClient
+from api_toolkits.alphavantage_toolkit import AsyncAlphaVantageClient
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
+from api_toolkits.async_base_client import close_shared_session, shared_session
+from api_toolkits.cache import FileCache
+from api_toolkits.json_utils import write_json, write_section
 
 def format_output(data: dict, indent: int = 2) -> None:
-    """Helper function to pretty print JSON data."""
-    print(json.dumps(data, indent=indent))
-
-def test_combined_apis():
-    """Test combined functionality of all three API toolkits."""
-    
-    # Initialize all clients
-    fh_client = FinnhubClient()
-    td_client = TwelveDataClient()
-    av_client = AlphaVantageClient()
-    
+    """Helper function to pretty print JSON data, streaming lists row by row."""
+    write_json(data, indent=indent)
+
+# Fields printed, in order, for responses whose shape is known in advance
+SHAPES = {
+    'fh_profile': ['name', 'ticker', 'exchange', 'country', 'currency', 'finnhubIndustry',
+                   'ipo', 'marketCapitalization', 'shareOutstanding', 'weburl'],
+    'fh_quote': ['c', 'd', 'dp', 'h', 'l', 'o', 'pc', 't'],
+    'td_quote': ['symbol', 'name', 'exchange', 'currency', 'datetime', 'open', 'high', 'low',
+                 'close', 'volume', 'previous_close', 'change', 'percent_change'],
+    'av_quote': ['01. symbol', '02. open', '03. high', '04. low', '05. price', '06. volume',
+                 '07. latest trading day', '08. previous close', '09. change', '10. change percent']
+}
+
+def _shape_formatter(fields: List[str]) -> Callable[[Dict[str, Any]], str]:
+    """Build a formatter printing ``key: value`` lines for a fixed list of keys."""
+    template = "".join(f"{key}: {{}}\n" for key in fields).format
+    return lambda data: template(*[data.get(key, 'N/A') for key in fields])
+
+# Shape name -> formatter, built once at import
+FORMATTERS = {name: _shape_formatter(fields) for name, fields in SHAPES.items()}
+
+# Article fields shown in the news summary and the block printed for each
+ARTICLE_FIELDS = ('headline', 'summary', 'source')
+ARTICLE_TEMPLATE = "\nHeadline: {}\nSummary: {}\nSource: {}\n".format
+
+def article_fields(article: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return the displayed fields of an article, with 'N/A' for missing ones."""
+    return tuple(article.get(field, 'N/A') for field in ARTICLE_FIELDS)
+
+@lru_cache(maxsize=4)
+def _date_range(days: int, today: date) -> Tuple[str, str]:
+    """Return the (from, to) YYYY-MM-DD strings for the last ``days`` days up to ``today``."""
+    return (today - timedelta(days=days)).isoformat(), today.isoformat()
+
+async def test_combined_apis():
+    """Test combined functionality of all three API toolkits.
+
+    Independent requests to the three providers are issued together with
+    asyncio.gather, so each menu option takes about as long as its slowest call.
+    """
+
+    # Initialize all clients on one shared connection pool, caching responses
+    # on disk between runs
+    session = shared_session()
+    fh_client = AsyncFinnhubClient(cache=FileCache('finnhub'), session=session)
+    td_client = AsyncTwelveDataClient(cache=FileCache('twelvedata'), session=session)
+    av_client = AsyncAlphaVantageClient(cache=FileCache('alphavantage'), session=session)
+
     try:
         while True:
             print("\nCombined API Test Menu:")
@@ -25,161 +70,131 @@ def test_combined_apis():
             print("3. News and Technical Analysis")
             print("4. Company Research")
             print("5. Exit")
-            
-            choice = input("\nEnter your choice (1-5): ")
-            
+
+            choice = await asyncio.to_thread(input, "\nEnter your choice (1-5): ")
+
             if choice == "5":
                 print("Exiting...")
                 break
-                
+
             if choice in ["1", "2", "3", "4"]:
-                symbol = input("Enter a stock symbol (e.g., AAPL): ").upper()
-            
+                symbol = (await asyncio.to_thread(input, "Enter a stock symbol (e.g., AAPL): ")).upper()
+
             try:
                 if choice == "1":
                     # Comprehensive Stock Analysis
                     print(f"\nPerforming comprehensive analysis for {symbol}...")
-                    
-                    # Get company profile from Finnhub
+
+                    profile, indicators, overview = await asyncio.gather(
+                        fh_client.get_company_profile(symbol=symbol),
+                        td_client.get_technical_indicators_batch(
+                            symbol,
+                            "1day",
+                            [{"indicator": "rsi", "time_period": 14}, {"indicator": "macd"}]
+                        ),
+                        av_client.get_company_overview(symbol)
+                    )
+
+                    # Company profile from Finnhub
                     print("\n1. Company Profile (Finnhub):")
-                    profile = fh_client.get_company_profile(symbol=symbol)
-                    format_output(profile)
-                    
-                    # Get technical indicators from TwelveData
+                    sys.stdout.write(FORMATTERS['fh_profile'](profile))
+
+                    # Technical indicators from TwelveData
                     print("\n2. Technical Indicators (TwelveData):")
-                    # Get RSI
-                    rsi_data = td_client.get_technical_indicator(
-                        symbol=symbol,
-                        interval="1day",
-                        indicator="rsi",
-                        time_period=14
-                    )
-                    print("\nRSI (14-day):")
-                    format_output(rsi_data)
-                    
-                    # Get MACD
-                    macd_data = td_client.get_technical_indicator(
-                        symbol=symbol,
-                        interval="1day",
-                        indicator="macd"
-                    )
-                    print("\nMACD:")
-                    format_output(macd_data)
-                    
-                    # Get fundamentals from AlphaVantage
-                    print("\n3. Company Overview (AlphaVantage):")
-                    overview = av_client.get_company_overview(symbol)
-                    format_output(overview)
-                    
+                    write_section("RSI (14-day):", indicators["rsi"])
+                    write_section("MACD:", indicators["macd"])
+
+                    # Fundamentals from AlphaVantage
+                    write_section("3. Company Overview (AlphaVantage):", overview)
+
                 elif choice == "2":
                     # Multi-Source Price Comparison
                     print(f"\nComparing price data for {symbol} across sources...")
-                    
-                    # Finnhub quote
+
+                    fh_quote, td_quote, av_quote = await asyncio.gather(
+                        fh_client.get_quote(symbol),
+                        td_client.get_quote(symbol),
+                        av_client.get_global_quote(symbol)
+                    )
+
                     print("\n1. Finnhub Quote:")
-                    fh_quote = fh_client.get_quote(symbol)
-                    format_output(fh_quote)
-                    
-                    # TwelveData quote
+                    sys.stdout.write(FORMATTERS['fh_quote'](fh_quote))
+
                     print("\n2. TwelveData Quote:")
-                    td_quote = td_client.get_quote(symbol)
-                    format_output(td_quote)
-                    
-                    # AlphaVantage quote
+                    sys.stdout.write(FORMATTERS['td_quote'](td_quote))
+
                     print("\n3. AlphaVantage Quote:")
-                    av_quote = av_client.get_global_quote(symbol)
-                    format_output(av_quote)
-                    
+                    sys.stdout.write(FORMATTERS['av_quote'](av_quote.get('Global Quote', {})))
+
                 elif choice == "3":
                     # News and Technical Analysis
                     print(f"\nGathering news and technical analysis for {symbol}...")
-                    
+
                     # Get recent news from Finnhub
-                    end_date = datetime.now()
-                    start_date = end_date - timedelta(days=7)
-                    
+                    from_date, to_date = _date_range(7, date.today())
+
                     print("\n1. Recent News (Finnhub):")
-                    news = fh_client.get_company_news(
-                        symbol,
-                        from_date=start_date.strftime("%Y-%m-%d"),
-                        to_date=end_date.strftime("%Y-%m-%d")
-                    )
-                    print(f"\nFound {len(news)} recent news articles")
-                    for article in news[:5]:  # Show only first 5 articles
-                        print(f"\nHeadline: {article.get('headline', 'N/A')}")
-                        print(f"Summary: {article.get('summary', 'N/A')}")
-                        print(f"Source: {article.get('source', 'N/A')}")
-                    
+                    # Stop reading the stream after the first 5 articles, closing it right away
+                    news = []
+                    async with aclosing(fh_client.iter_company_news(symbol, from_date=from_date, to_date=to_date)) as articles:
+                        async for article in articles:
+                            news.append(article)
+                            if len(news) == 5:
+                                break
+                    print(f"\nShowing the {len(news)} most recent news articles")
+                    sys.stdout.write("".join(ARTICLE_TEMPLATE(*article_fields(article)) for article in news))
+
                     # Get technical analysis from TwelveData
                     print("\n2. Technical Analysis (TwelveData):")
-                    
-                    # Instead of Bollinger Bands, let's use RSI and MACD
-                    print("\nRSI (14-day):")
-                    rsi_data = td_client.get_technical_indicator(
-                        symbol=symbol,
-                        interval="1day",
-                        indicator="rsi",
-                        time_period=14
-                    )
-                    format_output(rsi_data)
-                    
-                    print("\nMACD:")
-                    macd_data = td_client.get_technical_indicator(
-                        symbol=symbol,
-                        interval="1day",
-                        indicator="macd"
-                    )
-                    format_output(macd_data)
-                    
-                    # Add SMA for trend context
-                    print("\n20-day Simple Moving Average:")
-                    sma = td_client.get_technical_indicator(
-                        symbol=symbol,
-                        interval="1day",
-                        indicator="sma",
-                        time_period=20
+
+                    # RSI, MACD and a 20-day SMA for trend context, in one batched request
+                    indicators = await td_client.get_technical_indicators_batch(
+                        symbol,
+                        "1day",
+                        [
+                            {"indicator": "rsi", "time_period": 14},
+                            {"indicator": "macd"},
+                            {"indicator": "sma", "time_period": 20}
+                        ]
                     )
-                    format_output(sma)
-                    
+
+                    write_section("RSI (14-day):", indicators["rsi"])
+
+                    write_section("MACD:", indicators["macd"])
+
+                    write_section("20-day Simple Moving Average:", indicators["sma"])
+
                 elif choice == "4":
                     # Company Research
                     print(f"\nGathering comprehensive company research for {symbol}...")
-                    
-                    # Get company overview from AlphaVantage
-                    print("\n1. Company Overview (AlphaVantage):")
-                    overview = av_client.get_company_overview(symbol)
-                    format_output(overview)
-                    
-                    # Get earnings data from AlphaVantage
-                    print("\n2. Earnings Data (AlphaVantage):")
-                    earnings = av_client.get_earnings(symbol)
-                    if 'quarterlyEarnings' in earnings:
-                        print("\nRecent Quarterly Earnings:")
-                        format_output(earnings['quarterlyEarnings'][:4])  # Last 4 quarters
-                    
-                    # Get recommendation trends from Finnhub
-                    print("\n3. Analyst Recommendations (Finnhub):")
-                    recommendations = fh_client.get_recommendation_trends(symbol)
-                    format_output(recommendations)
-                    
-                    # Get time series from TwelveData
-                    print("\n4. Recent Price Action (TwelveData):")
-                    time_series = td_client.get_time_series(
-                        symbol=symbol,
-                        interval="1day",
-                        outputsize=30
+
+                    overview, earnings, recommendations, time_series = await asyncio.gather(
+                        av_client.get_company_overview(symbol),
+                        av_client.get_earnings(symbol),
+                        fh_client.get_recommendation_trends(symbol),
+                        td_client.get_time_series(
+                            symbol=symbol,
+                            interval="1day",
+                            outputsize=30
+                        )
                     )
-                    format_output(time_series)
-                
+
+                    # One document, encoded and written in a single call
+                    format_output({
+                        "overview": overview,  # AlphaVantage
+                        "earnings": earnings.get('quarterlyEarnings', [])[:4],  # AlphaVantage, last 4 quarters
+                        "recommendations": recommendations,  # Finnhub
+                        "time_series": time_series  # TwelveData
+                    })
+
             except Exception as e:
                 print(f"Error: {str(e)}")
-                
+
     finally:
-        # Close all clients
-        fh_client.close()
-        av_client.close()
+        # Close the shared session used by all clients
+        await close_shared_session()
 
 if __name__ == "__main__":
     print("Combined API Toolkits Test")
     print("=" * 50)
-    test_combined_apis() 
\ No newline at end of file
+    asyncio.run(test_combined_apis())
@@ -1,50 +1,65 @@
 """Test script for Finnhub API toolkit - News fetching functionality."""
-from datetime import datetime, timedelta
-from api_toolkits.finnhub_toolkit import FinnhubClient
+import asyncio
+import sys
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Tuple
+from api_toolkits.finnhub_toolkit import AsyncFinnhubClient
+from api_toolkits.cache import FileCache
 
-def get_recent_news():
+# Article fields in display order and the block printed for each article
+ARTICLE_FIELDS = ('headline', 'summary', 'source', 'url')
+ARTICLE_TEMPLATE = (
+    "Article {}:\nHeadline: {}\nSummary: {}\nSource: {}\nURL: {}\nDate: {}\n" + "-" * 80 + "\n\n"
+).format
+
+def article_fields(article: dict) -> Tuple[Any, ...]:
+    """Return the displayed fields of an article, with 'N/A' for missing ones."""
+    return tuple(article.get(field, 'N/A') for field in ARTICLE_FIELDS)
+
+@lru_cache(maxsize=4)
+def _date_range(days: int, today: date) -> Tuple[str, str]:
+    """Return the (from, to) YYYY-MM-DD strings for the last ``days`` days up to ``today``."""
+    return (today - timedelta(days=days)).isoformat(), today.isoformat()
+
+async def get_recent_news():
     """Fetch news articles from the last 7 days for a user-specified ticker."""
     
-    # Initialize the Finnhub client
-    client = FinnhubClient()
+    # Initialize the Finnhub client, caching responses on disk between runs
+    client = AsyncFinnhubClient(cache=FileCache('finnhub'))
     
     # Get user input for ticker
-    ticker = input("Enter a stock ticker (e.g., AAPL): ").upper()
-    
-    # Calculate date range (last 7 days)
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=7)
+    ticker = (await asyncio.to_thread(input, "Enter a stock ticker (e.g., AAPL): ")).upper()
     
-    # Format dates as required by the API (YYYY-MM-DD)
-    from_date = start_date.strftime("%Y-%m-%d")
-    to_date = end_date.strftime("%Y-%m-%d")
+    # Date range (last 7 days) as required by the API (YYYY-MM-DD)
+    from_date, to_date = _date_range(7, date.today())
     
     try:
         # Fetch news articles
         print(f"\nFetching news for {ticker} from {from_date} to {to_date}...")
-        news = client.get_company_news(ticker, from_date, to_date)
+        news = await client.get_company_news(ticker, from_date, to_date)
         
         if not news:
             print(f"No news articles found for {ticker} in the last 7 days.")
             return
         
         # Display the news articles
-        print(f"\nFound {len(news)} articles:\n")
-        for i, article in enumerate(news, 1):
-            print(f"Article {i}:")
-            print(f"Headline: {article.get('headline', 'N/A')}")
-            print(f"Summary: {article.get('summary', 'N/A')}")
-            print(f"Source: {article.get('source', 'N/A')}")
-            print(f"URL: {article.get('url', 'N/A')}")
-            print(f"Date: {datetime.fromtimestamp(article.get('datetime', 0)).strftime('%Y-%m-%d %H:%M:%S')}")
-            print("-" * 80 + "\n")
+        print(f"\nFound {len(news)} articles for {ticker}:\n")
+        sys.stdout.write("".join(
+            ARTICLE_TEMPLATE(
+                i, *article_fields(article),
+                datetime.fromtimestamp(article.get('datetime', 0)).strftime('%Y-%m-%d %H:%M:%S')
+            )
+            for i, article in enumerate(news, 1)
+        ))
+        sys.stdout.flush()
             
     except Exception as e:
         print(f"Error fetching news: {str(e)}")
     finally:
-        client.close()
+        await client.close()
 
 if __name__ == "__main__":
     print("Finnhub News Fetcher")
     print("=" * 50)
-    get_recent_news() 
\ No newline at end of file
+    asyncio.run(get_recent_news()) 
\ No newline at end of file
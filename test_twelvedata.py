@@ -1,112 +1,158 @@
 """Test script for TwelveData API toolkit - Time series and technical analysis."""
+import sys
+from itertools import islice
 from api_toolkits.twelvedata_toolkit import TwelveDataClient
-from datetime import datetime
-import json
+from api_toolkits.cache import FileCache
+from api_toolkits.json_utils import write_json, write_section
 
 def format_output(data: dict, indent: int = 2) -> None:
-    """Helper function to pretty print JSON data."""
-    print(json.dumps(data, indent=indent))
+    """Helper function to pretty print JSON data, streaming lists row by row."""
+    write_json(data, indent=indent)
+
+MENU = "\n".join([
+    "\nTwelveData API Test Menu:",
+    "1. Get Time Series Data",
+    "2. Get Real-time Quote",
+    "3. Get Technical Indicators",
+    "4. Get Stock List",
+    "5. Exit"
+])
+
+# Indicator -> (parameter, prompt label, type, default); None means the value is required
+INDICATOR_PARAMS = {
+    'sma': [('time_period', "time period", int, None)],
+    'ema': [('time_period', "time period", int, None)],
+    'rsi': [('time_period', "time period", int, None)],
+    'macd': [
+        ('fast_period', "fast period", int, 12),
+        ('slow_period', "slow period", int, 26),
+        ('signal_period', "signal period", int, 9)
+    ],
+    'bbands': [
+        ('time_period', "time period", int, 20),
+        ('std_dev', "standard deviation", float, 2)
+    ]
+}
+
+# Intervals accepted by the time series and indicator endpoints
+INTERVALS = frozenset(['1min', '5min', '15min', '30min', '45min', '1h', '2h', '4h', '8h',
+                       '1day', '1week', '1month'])
+INTERVAL_PROMPT = "Enter interval (1min, 5min, 15min, 30min, 45min, 1h, 2h, 4h, 8h, 1day, 1week, 1month): "
+
+def ask_choice(prompt: str, valid) -> str:
+    """Read a case-insensitive value and check it against the valid keys.
+    
+    Raises:
+        ValueError: If the value is not one of ``valid``
+    """
+    value = sys.intern(input(prompt).strip().casefold())
+    if value not in valid:
+        raise ValueError(f"Unsupported value {value!r}; expected one of {', '.join(sorted(valid))}")
+    return value
+
+def ask_symbol() -> str:
+    """Read a stock symbol."""
+    return input("Enter a stock symbol (e.g., AAPL): ").upper()
+
+def ask_indicator_params(indicator: str) -> dict:
+    """Prompt for the parameters of an indicator, falling back to their defaults."""
+    params = {}
+    for name, label, cast, default in INDICATOR_PARAMS[indicator]:
+        if default is None:
+            params[name] = cast(input(f"Enter {label}: "))
+        else:
+            params[name] = cast(input(f"Enter {label} (default {default}): ") or default)
+    return params
+
+def do_time_series(client: TwelveDataClient) -> None:
+    """Time Series Data"""
+    symbol = ask_symbol()
+    interval = ask_choice(INTERVAL_PROMPT, INTERVALS)
+    outputsize = int(input("Enter number of data points (1-5000): "))
+    
+    print(f"\nFetching time series data for {symbol}...")
+    data = client.get_time_series(
+        symbol=symbol,
+        interval=interval,
+        outputsize=outputsize,
+        timezone="America/New_York"
+    )
+    format_output(data)
+
+def do_quote(client: TwelveDataClient) -> None:
+    """Real-time Quote"""
+    symbol = ask_symbol()
+    print(f"\nFetching real-time quote for {symbol}...")
+    format_output(client.get_quote(symbol))
+
+def do_indicator(client: TwelveDataClient) -> None:
+    """Technical Indicators"""
+    symbol = ask_symbol()
+    print("\nAvailable indicators: " + ", ".join(INDICATOR_PARAMS))
+    indicator = ask_choice("Enter indicator name: ", INDICATOR_PARAMS)
+    interval = ask_choice(INTERVAL_PROMPT, INTERVALS)
+    params = ask_indicator_params(indicator)
+    
+    print(f"\nFetching {indicator.upper()} data for {symbol}...")
+    data = client.get_technical_indicator(
+        symbol=symbol,
+        interval=interval,
+        indicator=indicator,
+        **params
+    )
+    format_output(data)
+
+def do_stock_list(client: TwelveDataClient) -> None:
+    """Stock List"""
+    exchange = input("Enter exchange (e.g., NASDAQ) or press Enter for all: ")
+    stock_type = input("Enter type (e.g., Common Stock) or press Enter for all: ")
+    
+    print("\nFetching stock list...")
+    stocks = client.iter_stocks_list(
+        exchange=exchange or None,
+        type=stock_type or None
+    )
+    
+    # Display the first 10 stocks and stop reading the listing there; the
+    # response has no count field, so a total would mean parsing every row
+    first = list(islice(stocks, 10))
+    stocks.close()
+    write_section(f"First {len(first)} stocks in the list:", first)
+
+# Menu choice -> handler
+HANDLERS = {
+    '1': do_time_series,
+    '2': do_quote,
+    '3': do_indicator,
+    '4': do_stock_list
+}
 
 def test_twelvedata():
     """Test various TwelveData API functionalities."""
     
-    # Initialize the TwelveData client
-    client = TwelveDataClient()
+    # Initialize the TwelveData client, caching responses on disk between runs
+    client = TwelveDataClient(cache=FileCache('twelvedata'))
     
     while True:
-        print("\nTwelveData API Test Menu:")
-        print("1. Get Time Series Data")
-        print("2. Get Real-time Quote")
-        print("3. Get Technical Indicators")
-        print("4. Get Stock List")
-        print("5. Exit")
+        print(MENU)
         
         choice = input("\nEnter your choice (1-5): ")
         
         if choice == "5":
             print("Exiting...")
             break
-            
-        # Get symbol input for all options except 4
-        if choice != "4":
-            symbol = input("Enter a stock symbol (e.g., AAPL): ").upper()
+        
+        handler = HANDLERS.get(choice)
+        if handler is None:
+            print("Invalid choice. Please try again.")
+            continue
         
         try:
-            if choice == "1":
-                # Time Series Data
-                interval = input("Enter interval (1min, 5min, 1hour, 1day, 1week, 1month): ")
-                outputsize = int(input("Enter number of data points (1-5000): "))
-                
-                print(f"\nFetching time series data for {symbol}...")
-                data = client.get_time_series(
-                    symbol=symbol,
-                    interval=interval,
-                    outputsize=outputsize,
-                    timezone="America/New_York"
-                )
-                format_output(data)
-                
-            elif choice == "2":
-                # Real-time Quote
-                print(f"\nFetching real-time quote for {symbol}...")
-                quote = client.get_quote(symbol)
-                format_output(quote)
-                
-            elif choice == "3":
-                # Technical Indicators
-                print("\nAvailable indicators: sma, ema, rsi, macd, bbands")
-                indicator = input("Enter indicator name: ").lower()
-                interval = input("Enter interval (1min, 5min, 1hour, 1day): ")
-                
-                # Get additional parameters based on indicator
-                params = {}
-                if indicator in ['sma', 'ema', 'rsi']:
-                    time_period = int(input("Enter time period: "))
-                    params['time_period'] = time_period
-                elif indicator == 'macd':
-                    params.update({
-                        'fast_period': int(input("Enter fast period (default 12): ") or "12"),
-                        'slow_period': int(input("Enter slow period (default 26): ") or "26"),
-                        'signal_period': int(input("Enter signal period (default 9): ") or "9")
-                    })
-                elif indicator == 'bbands':
-                    params.update({
-                        'time_period': int(input("Enter time period (default 20): ") or "20"),
-                        'std_dev': float(input("Enter standard deviation (default 2): ") or "2")
-                    })
-                
-                print(f"\nFetching {indicator.upper()} data for {symbol}...")
-                data = client.get_technical_indicator(
-                    symbol=symbol,
-                    interval=interval,
-                    indicator=indicator,
-                    **params
-                )
-                format_output(data)
-                
-            elif choice == "4":
-                # Stock List
-                exchange = input("Enter exchange (e.g., NASDAQ) or press Enter for all: ")
-                stock_type = input("Enter type (e.g., Common Stock) or press Enter for all: ")
-                
-                print("\nFetching stock list...")
-                stocks = client.get_stocks_list(
-                    exchange=exchange or None,
-                    type=stock_type or None
-                )
-                
-                # Display first 10 stocks
-                print("\nFirst 10 stocks in the list:")
-                format_output(stocks[:10])
-                print(f"\nTotal stocks found: {len(stocks)}")
-                
-            else:
-                print("Invalid choice. Please try again.")
-                
+            handler(client)
         except Exception as e:
             print(f"Error: {str(e)}")
             
 if __name__ == "__main__":
     print("TwelveData API Toolkit Test")
     print("=" * 50)
-    test_twelvedata() 
\ No newline at end of file
+    test_twelvedata()
\ No newline at end of file
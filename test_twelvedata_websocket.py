@@ -1,21 +1,58 @@
 """Test script for TwelveData WebSocket functionality."""
 import asyncio
+import sys
+import time
+from functools import lru_cache
+from typing import List, Optional
 from api_toolkits.twelvedata_toolkit import TwelveDataClient
-import json
-from datetime import datetime
+from api_toolkits.json_utils import dumps
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Price updates waiting to be printed; the oldest are dropped if the writer falls behind
+queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
 
 async def on_message(message: dict) -> None:
     """Handle incoming WebSocket messages.
     
+    Messages are only queued here; printing happens in the writer task.
+    
     Args:
         message: Message data from WebSocket
     """
-    # Format timestamp
-    timestamp = datetime.fromtimestamp(message.get('timestamp', 0))
-    formatted_time = timestamp.strftime('%Y-%m-%d %H:%M:%S')
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+@lru_cache(maxsize=256)
+def format_time(timestamp: int) -> str:
+    """Format a UNIX timestamp; ticks arriving in the same second share the result."""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+def format_message(message: dict) -> str:
+    """Format a price update for display."""
+    return f"\nReceived price update at {format_time(message.get('timestamp', 0))}:\n{dumps(message, indent=2)}\n"
+
+def write_messages(messages: List[dict]) -> None:
+    """Format price updates and write them to stdout in one call."""
+    sys.stdout.write("".join(map(format_message, messages)))
+    sys.stdout.flush()
+
+async def writer() -> None:
+    """Print queued price updates until cancelled.
     
-    print(f"\nReceived price update at {formatted_time}:")
-    print(json.dumps(message, indent=2))
+    Everything queued since the last write is formatted and written in one
+    go from a worker thread, so neither formatting nor a slow terminal runs
+    on the event loop that reads the socket.
+    """
+    while True:
+        messages = [await queue.get()]
+        while not queue.empty():
+            messages.append(queue.get_nowait())
+        await asyncio.to_thread(write_messages, messages)
 
 async def on_error(error: Exception) -> None:
     """Handle WebSocket errors.
@@ -25,45 +62,66 @@ async def on_error(error: Exception) -> None:
     """
     print(f"Error occurred: {str(error)}")
 
+def ask_symbols(message: str) -> List[str]:
+    """Read a comma-separated list of symbols."""
+    return [s.strip().upper() for s in input(message).split(",") if s.strip()]
+
 async def test_websocket():
-    """Test TwelveData WebSocket functionality."""
+    """Test TwelveData WebSocket functionality.
+    
+    One connection stays open for the whole session; menu choices only send
+    subscribe/unsubscribe frames for the symbols that changed.
+    """
     client = TwelveDataClient()
+    stream: Optional[asyncio.Task] = None
+    writer_task = asyncio.create_task(writer())
     
     print("TwelveData WebSocket Test")
     print("=" * 50)
     
-    while True:
-        print("\nWebSocket Test Menu:")
-        print("1. Subscribe to symbols")
-        print("2. Exit")
-        
-        choice = input("\nEnter your choice (1-2): ")
-        
-        if choice == "2":
-            print("Exiting...")
-            break
+    try:
+        while True:
+            print("\nWebSocket Test Menu:")
+            print("1. Subscribe to symbols")
+            print("2. Unsubscribe from symbols")
+            print("3. Exit")
             
-        if choice == "1":
-            # Get symbols input
-            symbols_input = input("Enter symbols (comma-separated, e.g., AAPL,MSFT,GOOGL): ")
-            symbols = [s.strip() for s in symbols_input.split(",")]
+            # Read input in a thread so price updates keep streaming meanwhile
+            choice = await asyncio.to_thread(input, "\nEnter your choice (1-3): ")
             
-            print(f"\nConnecting to WebSocket and subscribing to: {', '.join(symbols)}")
-            print("Press Ctrl+C to stop receiving updates\n")
+            if choice == "3":
+                print("Exiting...")
+                break
             
-            try:
-                await client.start_websocket(
-                    symbols=symbols,
-                    on_message=on_message,
-                    on_error=on_error
-                )
-            except KeyboardInterrupt:
-                print("\nStopping WebSocket connection...")
-            finally:
-                await client.close_websocket()
-        else:
-            print("Invalid choice. Please try again.")
+            if choice == "1":
+                symbols = await asyncio.to_thread(ask_symbols, "Enter symbols (comma-separated, e.g., AAPL,MSFT,GOOGL): ")
+                if stream is None or stream.done():
+                    print(f"\nConnecting to WebSocket and subscribing to: {', '.join(symbols)}")
+                    await client.connect_websocket()
+                    stream = asyncio.create_task(client.start_websocket(
+                        symbols=symbols,
+                        on_message=on_message,
+                        on_error=on_error
+                    ))
+                else:
+                    print(f"\nSubscribing to: {', '.join(symbols)}")
+                    await client.subscribe(symbols)
+            elif choice == "2":
+                symbols = await asyncio.to_thread(ask_symbols, "Enter symbols to unsubscribe from: ")
+                await client.unsubscribe(symbols)
+            else:
+                print("Invalid choice. Please try again.")
+    finally:
+        print("\nStopping WebSocket connection...")
+        tasks = [task for task in (stream, writer_task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await client.close_websocket()
 
 if __name__ == "__main__":
-    # Run the async test
-    asyncio.run(test_websocket()) 
\ No newline at end of file
+    # Run the async test, on uvloop when it is installed
+    if uvloop is not None:
+        uvloop.run(test_websocket())
+    else:
+        asyncio.run(test_websocket())